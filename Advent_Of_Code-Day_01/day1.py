@@ -1,4 +1,16 @@
+import heapq
+import math
+import mmap
+import os
+import tempfile
+from array import array
+from bisect import bisect_right
 from collections import Counter
+from itertools import islice
+from operator import mul, sub
+
+# Pairs held in memory at once before process_large_file switches to an external sort
+MAX_PAIRS_IN_MEMORY = 10_000_000
 
 def read_lists_from_file(filename):
     """
@@ -78,5 +90,465 @@ def process_file(filename):
     print(f"Similarity Score: {similarity_score}")
     print("-----------------------------------")
 
-filename = "input.txt"  # Replace with your filename
-process_file(filename)
+def read_arrays_from_file(filename):
+    """
+    Bulk-parses a well-formed pair file into two int64 arrays.
+
+    Unlike read_lists_from_file, invalid lines are not skipped: the whole file
+    is split at once, so it must contain only whitespace-separated pairs.
+
+    Args:
+        filename (str): The name of the file containing the number pairs.
+
+    Returns:
+        tuple: Two arrays of numbers (left_array, right_array)
+    """
+    with open(filename, 'rb') as file:
+        numbers = array('q', map(int, file.read().split()))
+    if len(numbers) % 2:
+        raise ValueError("File must contain an even number of values")
+    return numbers[0::2], numbers[1::2]
+
+def total_distance_of_sorted(left_sorted, right_sorted):
+    """
+    Calculates the total distance between two already sorted sequences.
+
+    Args:
+        left_sorted (iterable): Left numbers in ascending order.
+        right_sorted (iterable): Right numbers in ascending order.
+
+    Returns:
+        int: The total distance between the two sequences.
+    """
+    return sum(map(abs, map(sub, left_sorted, right_sorted)))
+
+def similarity_of_sorted(left_sorted, right_sorted):
+    """
+    Calculates the similarity score by merge-joining two sorted sequences.
+
+    Each value contributes value * (count on the left) * (count on the right),
+    so no Counter over the right column is needed.
+
+    Args:
+        left_sorted (iterable): Left numbers in ascending order.
+        right_sorted (iterable): Right numbers in ascending order.
+
+    Returns:
+        int: The similarity score.
+    """
+    right_iter = iter(right_sorted)
+    right = next(right_iter, None)
+    score = 0
+    left_iter = iter(left_sorted)
+    left = next(left_iter, None)
+
+    while left is not None and right is not None:
+        if left < right:
+            left = next(left_iter, None)
+        elif right < left:
+            right = next(right_iter, None)
+        else:
+            value, left_count, right_count = left, 0, 0
+            while left == value:
+                left_count += 1
+                left = next(left_iter, None)
+            while right == value:
+                right_count += 1
+                right = next(right_iter, None)
+            score += value * left_count * right_count
+    return score
+
+def calculate_with_arrays(left_array, right_array):
+    """
+    Calculates distance and similarity from bulk-parsed arrays.
+
+    Args:
+        left_array (array): The left column.
+        right_array (array): The right column.
+
+    Returns:
+        tuple: (total_distance, similarity_score)
+    """
+    if len(left_array) != len(right_array):
+        raise ValueError("Lists must be of equal length")
+
+    right_counts = Counter(right_array)
+    similarity_score = sum(map(mul, left_array, map(right_counts.__getitem__, left_array)))
+    total_distance = total_distance_of_sorted(sorted(left_array), sorted(right_array))
+    return total_distance, similarity_score
+
+def _write_sorted_runs(filename, chunk_pairs, run_dir):
+    """
+    Splits the pair file into sorted int64 runs on disk, one set per column.
+
+    Returns:
+        tuple: Lists of run file paths (left_runs, right_runs)
+    """
+    left_runs, right_runs = [], []
+    with open(filename, 'rb') as file:
+        while True:
+            lines = list(islice(file, chunk_pairs))
+            if not lines:
+                break
+            numbers = array('q', map(int, b"".join(lines).split()))
+            if len(numbers) % 2:
+                raise ValueError("File must contain an even number of values")
+            if not numbers:
+                continue  # A chunk of blank lines; mmap cannot map an empty run
+
+            for column, runs in ((numbers[0::2], left_runs), (numbers[1::2], right_runs)):
+                run_path = os.path.join(run_dir, f"run-{len(left_runs) + len(right_runs)}.bin")
+                with open(run_path, 'wb') as run_file:
+                    array('q', sorted(column)).tofile(run_file)
+                runs.append(run_path)
+    return left_runs, right_runs
+
+def _merged_runs(run_paths, mapped):
+    """
+    Lazily merges sorted int64 run files, memory-mapping each one.
+
+    The maps are appended to `mapped` so the caller can close them.
+    """
+    views = []
+    for run_path in run_paths:
+        with open(run_path, 'rb') as run_file:
+            mapped.append(mmap.mmap(run_file.fileno(), 0, access=mmap.ACCESS_READ))
+        views.append(memoryview(mapped[-1]).cast('q'))
+    return heapq.merge(*views)
+
+def calculate_out_of_core(filename, chunk_pairs=MAX_PAIRS_IN_MEMORY):
+    """
+    Calculates distance and similarity with an external merge sort.
+
+    The file is read `chunk_pairs` lines at a time; each chunk's columns are
+    sorted and spilled to temporary run files, which are then memory-mapped
+    and k-way merged, so memory use is bounded by the chunk size.
+
+    Args:
+        filename (str): The name of the file containing the number pairs.
+        chunk_pairs (int): Number of pairs sorted in memory per run.
+
+    Returns:
+        tuple: (total_distance, similarity_score)
+    """
+    with tempfile.TemporaryDirectory() as run_dir:
+        left_runs, right_runs = _write_sorted_runs(filename, chunk_pairs, run_dir)
+        if sum(map(os.path.getsize, left_runs)) != sum(map(os.path.getsize, right_runs)):
+            raise ValueError("Lists must be of equal length")
+
+        mapped = []
+        try:
+            total_distance = total_distance_of_sorted(_merged_runs(left_runs, mapped),
+                                                      _merged_runs(right_runs, mapped))
+            similarity_score = similarity_of_sorted(_merged_runs(left_runs, mapped),
+                                                    _merged_runs(right_runs, mapped))
+        finally:
+            for mapping in mapped:
+                try:
+                    mapping.close()
+                except BufferError:
+                    pass  # A merge was abandoned mid-way; the map closes once its view is freed
+        return total_distance, similarity_score
+
+def process_large_file(filename, max_pairs_in_memory=MAX_PAIRS_IN_MEMORY):
+    """
+    Like process_file, but for very large well-formed pair files.
+
+    Files estimated to hold at most `max_pairs_in_memory` pairs are bulk-parsed
+    into arrays; larger files go through the external merge sort.
+
+    Args:
+        filename (str): The name of the file containing the number pairs.
+        max_pairs_in_memory (int): Largest pair count processed in memory.
+    """
+    try:
+        with open(filename, 'rb') as file:
+            first_line = file.readline()
+        estimated_pairs = os.path.getsize(filename) // max(len(first_line), 1)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return
+
+    if estimated_pairs <= max_pairs_in_memory:
+        total_distance, similarity_score = calculate_with_arrays(*read_arrays_from_file(filename))
+    else:
+        total_distance, similarity_score = calculate_out_of_core(filename, max_pairs_in_memory)
+
+    print("-----------------------------------")
+    print(f"Total Distance: {total_distance}")
+    print(f"Similarity Score: {similarity_score}")
+    print("-----------------------------------")
+
+class _DistanceBucket:
+    """
+    A run of consecutive breakpoints of the online distance curve.
+
+    Breakpoint i covers [keys[i], next key) with width lengths[i] and height
+    values[i] + lazy. hist maps stored heights to total width so a +/-1 shift
+    of the whole bucket is applied in O(1).
+    """
+
+    def __init__(self, keys, lengths, heights):
+        self.keys = keys
+        self.lengths = lengths
+        self.values = heights
+        self.lazy = 0
+        self.hist = Counter()
+        self.nonneg_len = 0
+        self.total_len = 0
+        for value, length in zip(heights, lengths):
+            self._account(value, length, 1)
+
+    def _account(self, value, length, sign):
+        self.hist[value] += sign * length
+        self.total_len += sign * length
+        if value + self.lazy >= 0:
+            self.nonneg_len += sign * length
+
+    def height(self, i):
+        return self.values[i] + self.lazy
+
+    def set_length(self, i, length):
+        self._account(self.values[i], self.lengths[i], -1)
+        self.lengths[i] = length
+        self._account(self.values[i], length, 1)
+
+    def insert(self, i, key, length, height):
+        self.keys.insert(i, key)
+        self.lengths.insert(i, length)
+        self.values.insert(i, height - self.lazy)
+        self._account(height - self.lazy, length, 1)
+
+    def add_range(self, start, stop, delta):
+        """Shifts breakpoints start..stop-1 by delta; returns the change in area."""
+        change = 0
+        for i in range(start, stop):
+            value, length = self.values[i], self.lengths[i]
+            old_height = value + self.lazy
+            self._account(value, length, -1)
+            self.values[i] = value + delta
+            self._account(value + delta, length, 1)
+            change += (abs(old_height + delta) - abs(old_height)) * length
+        return change
+
+    def add_all(self, delta):
+        """Shifts every breakpoint by delta (+1 or -1); returns the change in area."""
+        negative_len = self.total_len - self.nonneg_len
+        if delta > 0:
+            change = self.nonneg_len - negative_len
+            self.nonneg_len += self.hist[-1 - self.lazy]
+        else:
+            zero_len = self.hist[-self.lazy]
+            change = negative_len + zero_len - (self.nonneg_len - zero_len)
+            self.nonneg_len -= zero_len
+        self.lazy += delta
+        return change
+
+    def items(self):
+        return zip(self.keys, self.lengths, (value + self.lazy for value in self.values))
+
+
+class OnlineLocationLists:
+    """
+    Keeps the total distance and similarity score current as pairs stream in.
+
+    The similarity score only needs running counts of both columns. The total
+    distance uses the identity
+
+        sum(|left_i - right_i|) over sorted pairs == area under |C_L(x) - C_R(x)|
+
+    where C_L and C_R count the left/right values <= x. Adding the pair (l, r)
+    raises that difference curve by one on [l, r) (or lowers it on [r, l)),
+    so each update is a +/-1 range shift over the sorted breakpoints of the
+    curve. The breakpoints are kept in sqrt-sized buckets with lazy shifts,
+    making an update O(sqrt(n)) instead of re-sorting both columns.
+
+    Breakpoints of values that have been removed again are kept (the curve
+    is continuous across them), so memory grows with the distinct values seen.
+    """
+
+    MIN_LOAD = 32
+
+    def __init__(self, pairs=()):
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.total_distance = 0
+        self.similarity_score = 0
+        self._pairs = 0
+        self._buckets = []
+        self._firsts = []
+        self._breakpoints = 0
+        self._load = self.MIN_LOAD
+        pairs = list(pairs)
+        if pairs:
+            self._bulk_load(*zip(*pairs))
+
+    @classmethod
+    def from_lists(cls, left_list, right_list):
+        """
+        Builds the structure from two whole columns in O(n log n).
+
+        Args:
+            left_list (list): The left-list values.
+            right_list (list): The right-list values.
+        """
+        if len(left_list) != len(right_list):
+            raise ValueError("Lists must be of equal length")
+        lists = cls()
+        if left_list:
+            lists._bulk_load(left_list, right_list)
+        return lists
+
+    def _bulk_load(self, left_list, right_list):
+        """Sorts both columns once and lays out the whole difference curve in one pass."""
+        self.left_counts.update(left_list)
+        self.right_counts.update(right_list)
+        self._pairs = len(left_list)
+        self.similarity_score = sum(value * count * self.right_counts[value]
+                                    for value, count in self.left_counts.items())
+        self.total_distance = total_distance_of_sorted(sorted(left_list), sorted(right_list))
+
+        keys = sorted(self.left_counts.keys() | self.right_counts.keys())
+        heights, height = [], 0
+        for key in keys:
+            height += self.left_counts[key] - self.right_counts[key]
+            heights.append(height)
+        # The curve is zero past the last breakpoint, which therefore has no width
+        lengths = [following - key for key, following in zip(keys, keys[1:])] + [0]
+        self._buckets = [_DistanceBucket(keys, lengths, heights)]
+        self._firsts = [keys[0]]
+        self._breakpoints = len(keys)
+        self._rebuild()
+
+    def __len__(self):
+        return self._pairs
+
+    def add_pair(self, left, right):
+        """
+        Adds one location-ID pair.
+
+        Args:
+            left (int): The new left-list value.
+            right (int): The new right-list value.
+        """
+        self.similarity_score += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity_score += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        self._pairs += 1
+
+        self._ensure_breakpoint(left)
+        self._ensure_breakpoint(right)
+        if left < right:
+            self._shift(left, right, 1)
+        elif right < left:
+            self._shift(right, left, -1)
+
+    def remove_pair(self, left, right):
+        """
+        Removes one location-ID pair previously added.
+
+        Args:
+            left (int): The left-list value to remove.
+            right (int): The right-list value to remove.
+        """
+        if self.left_counts[left] == 0 or self.right_counts[right] == 0:
+            raise ValueError(f"Pair ({left}, {right}) is not in the lists")
+
+        self.right_counts[right] -= 1
+        self.similarity_score -= right * self.left_counts[right]
+        self.left_counts[left] -= 1
+        self.similarity_score -= left * self.right_counts[left]
+        self._pairs -= 1
+
+        if left < right:
+            self._shift(left, right, -1)
+        elif right < left:
+            self._shift(right, left, 1)
+
+    def _locate(self, key):
+        """Returns (bucket index, position) of the breakpoint at or before key."""
+        bucket_index = bisect_right(self._firsts, key) - 1
+        if bucket_index < 0:
+            return -1, -1
+        return bucket_index, bisect_right(self._buckets[bucket_index].keys, key) - 1
+
+    def _ensure_breakpoint(self, key):
+        if not self._buckets:
+            self._buckets.append(_DistanceBucket([key], [0], [0]))
+            self._firsts.append(key)
+            self._breakpoints = 1
+            return
+
+        bucket_index, i = self._locate(key)
+        if bucket_index < 0:
+            # Below every breakpoint, where the curve is flat at zero
+            self._buckets[0].insert(0, key, self._firsts[0] - key, 0)
+            self._firsts[0] = key
+            bucket_index = 0
+        else:
+            bucket = self._buckets[bucket_index]
+            if bucket.keys[i] == key:
+                return
+            if i + 1 < len(bucket.keys):
+                next_key = bucket.keys[i + 1]
+            elif bucket_index + 1 < len(self._buckets):
+                next_key = self._firsts[bucket_index + 1]
+            else:
+                next_key = key  # Past the last breakpoint, where the curve is zero again
+            bucket.set_length(i, key - bucket.keys[i])
+            bucket.insert(i + 1, key, next_key - key, bucket.height(i))
+
+        self._breakpoints += 1
+        if self._breakpoints > 4 * self._load * self._load:
+            self._rebuild()
+        elif len(self._buckets[bucket_index].keys) > 2 * self._load:
+            self._split(bucket_index)
+
+    def _split(self, bucket_index):
+        bucket = self._buckets[bucket_index]
+        items = list(bucket.items())
+        half = len(items) // 2
+        halves = [_DistanceBucket(*map(list, zip(*chunk))) for chunk in (items[:half], items[half:])]
+        self._buckets[bucket_index:bucket_index + 1] = halves
+        self._firsts[bucket_index:bucket_index + 1] = [half_bucket.keys[0] for half_bucket in halves]
+
+    def _rebuild(self):
+        """Re-chunks all breakpoints into buckets of about sqrt(n) entries."""
+        items = [item for bucket in self._buckets for item in bucket.items()]
+        self._load = max(self.MIN_LOAD, math.isqrt(len(items)))
+        self._buckets = [_DistanceBucket(*map(list, zip(*items[start:start + self._load])))
+                         for start in range(0, len(items), self._load)]
+        self._firsts = [bucket.keys[0] for bucket in self._buckets]
+
+    def _shift(self, start_key, stop_key, delta):
+        """Adds delta to the curve on [start_key, stop_key); both are breakpoints."""
+        start_bucket, start = self._locate(start_key)
+        stop_bucket, stop = self._locate(stop_key)
+        buckets = self._buckets
+        if start_bucket == stop_bucket:
+            change = buckets[start_bucket].add_range(start, stop, delta)
+        else:
+            change = buckets[start_bucket].add_range(start, len(buckets[start_bucket].keys), delta)
+            for bucket_index in range(start_bucket + 1, stop_bucket):
+                change += buckets[bucket_index].add_all(delta)
+            change += buckets[stop_bucket].add_range(0, stop, delta)
+        self.total_distance += change
+
+
+def parse(filename):
+    """Reads the location-ID lists for the batch runner."""
+    return read_lists_from_file(filename)
+
+
+def solve(lists, part2=False):
+    """Returns the total distance (part 1) or similarity score (part 2)."""
+    left_list, right_list = lists
+    if part2:
+        return calculate_similarity_score(left_list, right_list)
+    return calculate_total_distance(left_list[:], right_list[:])
+
+
+if __name__ == "__main__":
+    filename = "input.txt"  # Replace with your filename
+    process_file(filename)
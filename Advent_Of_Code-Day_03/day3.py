@@ -1,4 +1,16 @@
+import mmap
+import os
 import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+INSTRUCTION_BYTES = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+MAX_TOKEN_LENGTH = len(b"mul(999,999)")
+
+# Result of scanning one chunk without knowing whether muls are enabled at its start.
+# last_toggle is True/False for the chunk's final do()/don't(), or None if it has none.
+ChunkSummary = namedtuple("ChunkSummary", "sum_if_enabled sum_if_disabled last_toggle total_sum")
 '''[TASK-1]
 def calculate_mul_sum(filename):
     """Calculates the sum of results from valid mul instructions in a file.
@@ -25,6 +37,26 @@ def calculate_mul_sum(filename):
     return mul_sum
 '''
 # TASK-2
+def sum_enabled_muls(content, conditional=True):
+    """Sums the mul instructions in content, honouring do() and don't() if conditional."""
+    mul_sum = 0
+    enabled = True  # mul instructions are initially enabled
+
+    for match in re.finditer(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)", content):
+        instruction = match.group(0)
+
+        if instruction == "do()":
+            enabled = True
+        elif instruction == "don't()":
+            enabled = False
+        elif enabled or not conditional:  # Only process mul if enabled
+            num1 = int(match.group(1))
+            num2 = int(match.group(2))
+            mul_sum += num1 * num2
+
+    return mul_sum
+
+
 def calculate_mul_sum_with_conditions(filename):
     """Calculates the sum of enabled mul instructions, considering do() and don't().
 
@@ -42,27 +74,176 @@ def calculate_mul_sum_with_conditions(filename):
         print(f"Error: File '{filename}' not found.")
         return None
 
-    mul_sum = 0
-    enabled = True  # mul instructions are initially enabled
+    return sum_enabled_muls(content)
 
-    for match in re.finditer(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)", content):
+
+def scan_window(buffer, start, end, enabled=True, conditional=True):
+    """Scans buffer[start:end] for instructions without copying it.
+
+    Args:
+        buffer: Any bytes-like object (bytes, mmap, ...).
+        start, end: The byte range to scan; tokens crossing end are not matched.
+        enabled: Whether mul instructions are enabled at start.
+        conditional: Whether do() and don't() are honoured.
+
+    Returns:
+        A tuple (mul_sum, enabled, last_match_end).
+    """
+    mul_sum = 0
+    last_end = start
+    for match in INSTRUCTION_BYTES.finditer(buffer, start, end):
         instruction = match.group(0)
+        last_end = match.end()
 
-        if instruction == "do()":
+        if instruction == b"do()":
             enabled = True
-        elif instruction == "don't()":
+        elif instruction == b"don't()":
             enabled = False
-        elif enabled:  # Only process mul if enabled
-            num1 = int(match.group(1))
-            num2 = int(match.group(2))
-            mul_sum += num1 * num2
+        elif enabled or not conditional:  # Only process mul if enabled
+            mul_sum += int(match.group(1)) * int(match.group(2))
+
+    return mul_sum, enabled, last_end
+
+
+def calculate_mul_sum_streaming(filename, conditional=True, window_size=1 << 20):
+    """Calculates the mul sum of a memory-mapped file in fixed-size windows.
+
+    Memory use is bounded by the window size regardless of the file size.
+    Each window is scanned in place; the next one starts just after the last
+    match, or MAX_TOKEN_LENGTH - 1 bytes before the window end if that is
+    later, so a token cut by the boundary is picked up whole by the next
+    window and no token is counted twice. The do()/don't() state carries over.
+
+    Args:
+        filename: The path to the input file.
+        conditional: Whether do() and don't() are honoured (Task 2).
+        window_size: Bytes scanned per window.
+
+    Returns:
+        The sum of the multiplication results, or None if the file is not found.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return 0  # Empty files cannot be memory-mapped
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
 
+    window_size = max(window_size, MAX_TOKEN_LENGTH)
+    mul_sum = 0
+    enabled = True
+    start = 0
+    with data:
+        size = len(data)
+        while start < size:
+            end = min(start + window_size, size)
+            window_sum, enabled, last_end = scan_window(data, start, end, enabled, conditional)
+            mul_sum += window_sum
+            if end == size:
+                break
+            start = max(last_end, end - (MAX_TOKEN_LENGTH - 1))
     return mul_sum
 
 
-# Example usage:
-filename = "input.txt"  # Replace with your input file name
-result = calculate_mul_sum_with_conditions(filename)
+def summarize_chunk(filename, start, end):
+    """Scans the instructions that start in [start, end) of a file.
+
+    The scan runs up to MAX_TOKEN_LENGTH - 1 bytes past end so a token that
+    straddles the split is counted by the chunk it starts in. No instruction
+    can begin inside another one, so splitting by start offset matches
+    exactly the tokens a sequential scan finds.
+    """
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    sums = {True: 0, False: 0}  # Keyed by the enabled state assumed at start
+    states = {True: True, False: False}
+    last_toggle = None
+    total_sum = 0
+    with data:
+        scan_end = min(end + MAX_TOKEN_LENGTH - 1, len(data))
+        for match in INSTRUCTION_BYTES.finditer(data, start, scan_end):
+            if match.start() >= end:
+                break
+            instruction = match.group(0)
+            if instruction == b"do()":
+                last_toggle = states[True] = states[False] = True
+            elif instruction == b"don't()":
+                last_toggle = states[True] = states[False] = False
+            else:
+                product = int(match.group(1)) * int(match.group(2))
+                total_sum += product
+                for assumed, enabled in states.items():
+                    if enabled:
+                        sums[assumed] += product
+    return ChunkSummary(sums[True], sums[False], last_toggle, total_sum)
+
+
+def combine_chunks(left, right):
+    """Associatively merges the summaries of two adjacent chunks (left first)."""
+    def after_left(assumed):
+        return assumed if left.last_toggle is None else left.last_toggle
+
+    def right_sum(enabled):
+        return right.sum_if_enabled if enabled else right.sum_if_disabled
+
+    return ChunkSummary(
+        left.sum_if_enabled + right_sum(after_left(True)),
+        left.sum_if_disabled + right_sum(after_left(False)),
+        left.last_toggle if right.last_toggle is None else right.last_toggle,
+        left.total_sum + right.total_sum,
+    )
+
+
+def calculate_mul_sum_parallel(filename, conditional=True, workers=None, chunks=None):
+    """Calculates the mul sum by scanning byte ranges of the file in parallel.
+
+    Each worker returns a ChunkSummary; combining them left to right yields
+    exactly the result of calculate_mul_sum_with_conditions.
+
+    Args:
+        filename: The path to the input file.
+        conditional: Whether do() and don't() are honoured (Task 2).
+        workers: Number of worker processes (default: CPU count).
+        chunks: Number of byte ranges to split the file into (default: 4 per worker).
+
+    Returns:
+        The sum of the multiplication results, or None if the file is not found.
+    """
+    try:
+        size = os.path.getsize(filename)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        return None
+    if size == 0:
+        return 0
+
+    workers = workers or os.cpu_count()
+    chunks = max(1, min(chunks or 4 * workers, size))
+    bounds = [size * i // chunks for i in range(chunks + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = pool.map(summarize_chunk, [filename] * chunks, bounds[:-1], bounds[1:])
+        result = reduce(combine_chunks, summaries)
+    return result.sum_if_enabled if conditional else result.total_sum
+
+
+def parse(filename):
+    """Reads the corrupted memory dump as a single string."""
+    with open(filename, 'r') as f:
+        return f.read()
+
+
+def solve(content, part2=False):
+    """Sums every mul (part 1) or only the enabled ones (part 2)."""
+    return sum_enabled_muls(content, conditional=part2)
+
+
+if __name__ == "__main__":
+    # Example usage:
+    filename = "input.txt"  # Replace with your input file name
+    result = calculate_mul_sum_with_conditions(filename)
 
-if result is not None:
-    print(f"Sum of enabled multiplication results: {result}")
\ No newline at end of file
+    if result is not None:
+        print(f"Sum of enabled multiplication results: {result}")
@@ -1,3 +1,5 @@
+from collections import deque
+
 ''' [Task-01]
 def count_xmas(filename):
     """Counts the occurrences of "XMAS" (and its reverse) in a word search grid.
@@ -51,6 +53,11 @@ def count_x_mas(filename):
         print(f"Error: File '{filename}' not found.")
         return None
 
+    return count_x_mas_in_grid(grid)
+
+
+def count_x_mas_in_grid(grid):
+    """Counts X-MAS patterns in an already loaded grid."""
     rows = len(grid)
     cols = len(grid[0])
     count = 0
@@ -90,8 +97,177 @@ def count_x_mas(filename):
     return count
 
 
-# Example usage
-filename = "input.txt"
-xmas_count = count_x_mas(filename)
-if xmas_count is not None:
-    print(f"XMAS appears {xmas_count} times.")
\ No newline at end of file
+# All eight (row, column) directions a word can run in
+DIRECTIONS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+# The four orientations of two crossing MAS words, as (row, col, char) cells around the 'A'
+X_MAS_STENCILS = [
+    [(0, 0, 'A'), (-1, -1, top_left), (-1, 1, top_right), (1, -1, bottom_left), (1, 1, bottom_right)]
+    for top_left, top_right, bottom_left, bottom_right in
+    [('M', 'M', 'S', 'S'), ('S', 'S', 'M', 'M'), ('M', 'S', 'M', 'S'), ('S', 'M', 'S', 'M')]
+]
+
+
+class GridSearch:
+    """Matches words and 2D stencils against a grid using bitsets.
+
+    Each character gets one Python int with a bit per grid cell (rows laid out
+    with a zero padding gap so shifts cannot wrap into the next row). A
+    stencil matches at every anchor where all of its cells' masks, shifted
+    onto the anchor, are set, so a whole-grid match is a handful of big-int
+    shifts and ANDs instead of a Python loop per cell.
+    """
+
+    PAD = '\n'  # Never part of a stripped grid row
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self._masks = {}
+        self._padding = None
+
+    def _prepare(self, padding):
+        """(Re)builds the character masks with at least `padding` gap columns."""
+        if self._padding is not None and self._padding >= padding:
+            return
+        self._padding = padding
+        self._stride = self.cols + padding
+        gap = self.PAD * padding
+        # Reversed so that cell 0 ends up as the least significant bit
+        self._flat = "".join(row + gap for row in self.grid)[::-1].encode()
+        self._masks = {}
+        self._valid = self._mask_for(lambda byte: byte != ord(self.PAD))
+
+    def _mask_for(self, predicate):
+        table = bytes(ord('1') if predicate(byte) else ord('0') for byte in range(256))
+        bits = self._flat.translate(table)
+        return int(bits, 2) if bits else 0
+
+    def _char_mask(self, char):
+        if char not in self._masks:
+            self._masks[char] = self._mask_for(lambda byte: byte == ord(char))
+        return self._masks[char]
+
+    def match_mask(self, stencil):
+        """Returns the bitset of anchor cells where every (dr, dc, char) cell matches."""
+        stencil = list(stencil)
+        self._prepare(max((abs(dc) for _, dc, _ in stencil), default=0))
+        matches = self._valid
+        for dr, dc, char in stencil:
+            offset = dr * self._stride + dc
+            mask = self._char_mask(char)
+            matches &= mask >> offset if offset >= 0 else mask << -offset
+            if not matches:
+                break
+        return matches
+
+    def count_stencil(self, stencil):
+        """Counts the anchor cells where the stencil matches."""
+        return self.match_mask(stencil).bit_count()
+
+    def count_word(self, word, directions=DIRECTIONS):
+        """Counts occurrences of word running in any of the given directions."""
+        return sum(
+            self.count_stencil((i * dr, i * dc, char) for i, char in enumerate(word))
+            for dr, dc in directions
+        )
+
+    def count_x_mas(self):
+        """Counts X-MAS crosses (one per centre 'A')."""
+        return sum(self.count_stencil(stencil) for stencil in X_MAS_STENCILS)
+
+
+class AhoCorasick:
+    """Automaton that finds every occurrence of many words in one pass over a text."""
+
+    def __init__(self, words):
+        self.words = list(dict.fromkeys(words))
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, word in enumerate(self.words):
+            node = 0
+            for char in word:
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.output[node].append(index)
+
+        # Breadth-first so every fail link points at an already finished node
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] += self.output[self.fail[child]]
+
+    def count_into(self, text, counts):
+        """Adds the number of occurrences of each word in text to counts (by word index)."""
+        goto, fail, output = self.goto, self.fail, self.output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                counts[index] += 1
+
+
+def grid_lines(grid):
+    """Yields every row, column, diagonal and anti-diagonal of the grid, both ways."""
+    rows = len(grid)
+    cols = len(grid[0]) if grid else 0
+    lines = list(grid)
+    lines += ["".join(row[c] for row in grid) for c in range(cols)]
+    lines += ["".join(grid[r][r - d] for r in range(max(0, d), min(rows, cols + d)))
+              for d in range(-(cols - 1), rows)]
+    lines += ["".join(grid[r][s - r] for r in range(max(0, s - cols + 1), min(rows, s + 1)))
+              for s in range(rows + cols - 1)]
+    for line in lines:
+        yield line
+        yield line[::-1]
+
+
+def count_words(grid, words):
+    """Counts each word in all eight directions with a single pass per grid line.
+
+    Cost is proportional to the grid size (plus matches), not to the number of
+    words, since all words share one Aho-Corasick automaton. Counts agree with
+    GridSearch.count_word.
+    """
+    automaton = AhoCorasick(words)
+    counts = [0] * len(automaton.words)
+    for line in grid_lines(grid):
+        automaton.count_into(line, counts)
+    return dict(zip(automaton.words, counts))
+
+
+def parse(filename):
+    """Reads the word search grid as a list of rows."""
+    with open(filename, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def solve(grid, part2=False):
+    """Counts XMAS words (part 1) or X-MAS crosses (part 2)."""
+    search = GridSearch(grid)
+    if part2:
+        return search.count_x_mas()
+    return search.count_word("XMAS")
+
+
+if __name__ == "__main__":
+    # Example usage
+    filename = "input.txt"
+    xmas_count = count_x_mas(filename)
+    if xmas_count is not None:
+        print(f"XMAS appears {xmas_count} times.")
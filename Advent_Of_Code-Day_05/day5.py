@@ -1,4 +1,5 @@
 from collections import defaultdict, deque
+from functools import cmp_to_key
 
 def process_input(filename):
     """Reads and processes rules and updates efficiently."""
@@ -72,12 +73,203 @@ def calculate_middle_pages(updates, rules):
     return correctly_ordered_sum, reordered_sum
 
 
-# Main logic
-rules, updates = process_input('input.txt')
+class PageOrderingIndex:
+    """Precompiled page-ordering rules for validating and reordering updates.
 
-# Calculate results
-correct_sum, reorder_sum = calculate_middle_pages(updates, rules)
+    Every page gets a bit, and each page keeps the bitset of pages that have
+    a rule putting them before it. An update is ordered iff every page's
+    already-seen pages are a subset of its predecessors, which is one AND per
+    page instead of a scan over rule lists. The puzzle gives a rule for every
+    pair of pages in an update; when that holds the in-update predecessor
+    counts are 0..n-1, so the middle page is picked directly without sorting.
+    Updates without a complete rule set fall back to topological_sort.
+    """
 
-# Output
-print("Sum of Middle Pages for Correctly Ordered Updates:", correct_sum)
-print("Sum of Middle Pages After Reordering Incorrect Updates:", reorder_sum)
+    def __init__(self, rules):
+        self.rules = defaultdict(list)
+        self._bits = {}
+        self._before = defaultdict(int)
+        self._pairs = set()
+        for before, afters in rules.items():
+            for after in afters:
+                self.add_rule(before, after)
+
+    def bit(self, page):
+        if page not in self._bits:
+            self._bits[page] = 1 << len(self._bits)
+        return self._bits[page]
+
+    def add_rule(self, before, after):
+        """Adds a before|after rule; returns False if it was already present."""
+        if (before, after) in self._pairs:
+            return False
+        self._pairs.add((before, after))
+        self.rules[before].append(after)
+        self._before[after] |= self.bit(before)
+        return True
+
+    def remove_rule(self, before, after):
+        """Removes a before|after rule; returns False if it was not present."""
+        if (before, after) not in self._pairs:
+            return False
+        self._pairs.remove((before, after))
+        self.rules[before].remove(after)
+        self._before[after] &= ~self.bit(before)
+        return True
+
+    def is_ordered(self, update):
+        """Same result as is_update_ordered, in O(len(update)) bit operations."""
+        seen = 0
+        for page in update:
+            if seen & ~self._before[page]:
+                return False
+            seen |= self.bit(page)
+        return True
+
+    def compare(self, a, b):
+        """cmp_to_key comparator: negative if a must come before b."""
+        if (a, b) in self._pairs:
+            return -1
+        if (b, a) in self._pairs:
+            return 1
+        return 0
+
+    def reorder(self, update):
+        """Returns the update sorted by the rules."""
+        return sorted(update, key=cmp_to_key(self.compare))
+
+    def middle_of_reordered(self, update):
+        """Middle page of the reordered update, selected by predecessor count."""
+        mask = 0
+        for page in update:
+            mask |= self.bit(page)
+        counts = {page: (self._before[page] & mask).bit_count() for page in update}
+        n = len(update)
+        middle = (n + 1) // 2 - 1
+        if sum(counts.values()) == n * (n - 1) // 2 and len(set(counts.values())) == n:
+            for page, count in counts.items():
+                if count == middle:
+                    return page
+        # Rule cycles inside the update make the sort drop pages, so index its own length
+        sorted_update = topological_sort(update, self.rules)
+        return sorted_update[(len(sorted_update) + 1) // 2 - 1]
+
+    def middle_page_sums(self, updates):
+        """Same as calculate_middle_pages, using the compiled index."""
+        correctly_ordered_sum = 0
+        reordered_sum = 0
+        for update in updates:
+            if self.is_ordered(update):
+                correctly_ordered_sum += update[(len(update) + 1) // 2 - 1]
+            else:
+                reordered_sum += self.middle_of_reordered(update)
+        return correctly_ordered_sum, reordered_sum
+
+
+class PrintQueueService:
+    """Keeps both middle-page sums current while rules are added and removed.
+
+    An inverted index maps each page to the updates containing it, so a rule
+    change re-checks only the updates that hold both of its pages; every
+    other update's ordering cannot depend on that rule.
+    """
+
+    def __init__(self, rules, updates=()):
+        self.index = PageOrderingIndex(rules)
+        self.updates = []
+        self.correctly_ordered_sum = 0
+        self.reordered_sum = 0
+        self._results = []
+        self._updates_by_page = defaultdict(set)
+        for update in updates:
+            self.add_update(update)
+
+    def add_update(self, update):
+        """Registers a new print job and accounts for its middle page.
+
+        Raises ValueError, leaving the service unchanged, if the rules are
+        cyclic within the update.
+        """
+        update = list(update)
+        result = self._measure(update)
+        position = len(self.updates)
+        self.updates.append(update)
+        self._results.append((True, 0))
+        for page in update:
+            self._updates_by_page[page].add(position)
+        self._apply(position, result)
+
+    def add_rule(self, before, after):
+        """Adds a rule and returns the number of updates that were re-checked.
+
+        Raises ValueError, leaving the service unchanged, if the rule closes a
+        cycle within one of the updates.
+        """
+        if not self.index.add_rule(before, after):
+            return 0
+        return self._reevaluate(before, after, undo=self.index.remove_rule)
+
+    def remove_rule(self, before, after):
+        """Removes a rule and returns the number of updates that were re-checked."""
+        if not self.index.remove_rule(before, after):
+            return 0
+        return self._reevaluate(before, after, undo=self.index.add_rule)
+
+    def _reevaluate(self, before, after, undo):
+        affected = self._updates_by_page[before] & self._updates_by_page[after]
+        try:
+            # Every result is computed before any is applied, so a failure changes nothing
+            results = {position: self._measure(self.updates[position]) for position in affected}
+        except ValueError:
+            undo(before, after)
+            raise
+        for position, result in results.items():
+            self._apply(position, result)
+        return len(affected)
+
+    def _measure(self, update):
+        """Returns (ordered, middle page) for an update under the current rules."""
+        if self.index.is_ordered(update):
+            return True, update[(len(update) + 1) // 2 - 1]
+        # The sort drops every page on a rule cycle, so a short result means a cycle
+        sorted_update = topological_sort(update, self.index.rules)
+        if len(sorted_update) != len(update):
+            raise ValueError(f"Rules are cyclic within update {update}")
+        return False, sorted_update[(len(update) + 1) // 2 - 1]
+
+    def _apply(self, position, result):
+        ordered, middle = self._results[position]
+        if ordered:
+            self.correctly_ordered_sum -= middle
+        else:
+            self.reordered_sum -= middle
+
+        ordered, middle = self._results[position] = result
+        if ordered:
+            self.correctly_ordered_sum += middle
+        else:
+            self.reordered_sum += middle
+
+
+def parse(filename):
+    """Reads the rules and updates for the batch runner."""
+    return process_input(filename)
+
+
+def solve(data, part2=False):
+    """Returns the middle-page sum of ordered (part 1) or reordered (part 2) updates."""
+    rules, updates = data
+    correct_sum, reorder_sum = PageOrderingIndex(rules).middle_page_sums(updates)
+    return reorder_sum if part2 else correct_sum
+
+
+if __name__ == "__main__":
+    # Main logic
+    rules, updates = process_input('input.txt')
+
+    # Calculate results
+    correct_sum, reorder_sum = calculate_middle_pages(updates, rules)
+
+    # Output
+    print("Sum of Middle Pages for Correctly Ordered Updates:", correct_sum)
+    print("Sum of Middle Pages After Reordering Incorrect Updates:", reorder_sum)
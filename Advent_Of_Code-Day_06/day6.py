@@ -1,10 +1,11 @@
-import copy
+import os
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from multiprocessing import shared_memory
 from typing import Dict, Tuple, Optional, List
 
-SIZE = 130  # Adjust based on your input file size
-
 
 class Direction(Enum):
     NORTH = (0, -1)
@@ -54,71 +55,232 @@ def solve_part_one(map_data: Dict[Tuple[int, int], str], max_x: int, max_y: int)
     return len(visited)
 
 
-def solve_part_two(filename: str) -> int:
-    """Solves Part Two - Placing obstacles."""
-    # Create 2D lists for map, direction tracking, and obstacles
-    map_grid = [[' ' for _ in range(SIZE)] for _ in range(SIZE)]
-    dir_map = [[0 for _ in range(SIZE)] for _ in range(SIZE)]
-    obstacle_map = [[0 for _ in range(SIZE)] for _ in range(SIZE)]
+# Direction indices used by GuardMap, in turning order: NORTH, EAST, SOUTH, WEST
+DIRECTION_STEPS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
 
-    # Read input file
-    with open(filename, "r") as f:
-        for r in range(SIZE):
-            line = f.readline().strip()
-            for c, char in enumerate(line):
-                map_grid[r][c] = char
-                if char == '^':
-                    guard_row, guard_col = r, c
-
-    def solve_recursive(guard_row: int, guard_col: int, direction: int,
-                        depth: int, map_state: List[List[str]],
-                        dir_state: List[List[int]],
-                        obstacle_state: List[List[int]]) -> int:
-        count = 0
 
+class GuardMap:
+    """Guard map of any size with wall-to-wall jump tables for loop detection.
+
+    The map is stored as a flat list of cells. For each direction, jump[d][cell]
+    is the cell where the guard stops when walking that way from cell (the
+    cell just before the next wall), or -1 if it walks off the map. A loop
+    check with one extra obstacle then jumps from turn to turn, only patching
+    a jump when that obstacle lies in between, so it costs O(turns) rather
+    than a copy of the grid plus one step per cell.
+    """
+
+    def __init__(self, rows: List[str]):
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.walls = [char == '#' for row in rows for char in row]
+        self.start = next(r * self.width + c
+                          for r, row in enumerate(rows)
+                          for c, char in enumerate(row) if char == '^')
+        self.jump = self._build_jump_tables()
+        self._seen = [0] * (len(self.walls) * 4)
+        self._stamp = 0
+
+    @classmethod
+    def from_map_data(cls, map_data: Dict[Tuple[int, int], str], max_x: int, max_y: int) -> "GuardMap":
+        """Builds a GuardMap from the (x, y) -> char dict of generate_map."""
+        return cls(["".join(map_data[(x, y)] for x in range(max_x + 1)) for y in range(max_y + 1)])
+
+    def _build_jump_tables(self) -> List[List[int]]:
+        width, height, walls = self.width, self.height, self.walls
+        jump = [[-1] * len(walls) for _ in range(4)]
+        for d, (dr, dc) in enumerate(DIRECTION_STEPS):
+            # Sweep against the direction of travel so the stop cell is known on arrival
+            rows = range(height) if dr <= 0 else range(height - 1, -1, -1)
+            cols = range(width) if dc <= 0 else range(width - 1, -1, -1)
+            table = jump[d]
+            for r in rows:
+                for c in cols:
+                    cell = r * width + c
+                    if walls[cell]:
+                        continue
+                    nr, nc = r + dr, c + dc
+                    if not (0 <= nr < height and 0 <= nc < width):
+                        table[cell] = -1
+                    elif walls[nr * width + nc]:
+                        table[cell] = cell
+                    else:
+                        table[cell] = table[nr * width + nc]
+        return jump
+
+    def _stop(self, cell: int, d: int, obstacle: int) -> int:
+        """Where the guard stops walking in direction d, with one extra obstacle."""
+        stop = self.jump[d][cell]
+        width = self.width
+        r, c = divmod(cell, width)
+        obstacle_r, obstacle_c = divmod(obstacle, width)
+        if d == 0:  # NORTH
+            if obstacle_c == c and obstacle_r < r and (stop < 0 or obstacle_r >= stop // width):
+                return obstacle + width
+        elif d == 1:  # EAST
+            if obstacle_r == r and obstacle_c > c and (stop < 0 or obstacle_c <= stop % width):
+                return obstacle - 1
+        elif d == 2:  # SOUTH
+            if obstacle_c == c and obstacle_r > r and (stop < 0 or obstacle_r <= stop // width):
+                return obstacle - width
+        elif obstacle_r == r and obstacle_c < c and (stop < 0 or obstacle_c >= stop % width):  # WEST
+            return obstacle + 1
+        return stop
+
+    def loops_with_obstacle(self, cell: int, d: int, obstacle: int) -> bool:
+        """Checks whether the guard at (cell, d) loops once obstacle is added."""
+        self._stamp += 1
+        stamp, seen = self._stamp, self._seen
         while True:
-            if depth == 1 and map_state[guard_row][guard_col] == 'X' and \
-                    ((1 << direction) & dir_state[guard_row][guard_col]) != 0:
-                return 1
-
-            map_state[guard_row][guard_col] = 'X'
-            dir_state[guard_row][guard_col] |= 1 << direction
-
-            next_row, next_col = guard_row, guard_col
-
-            if direction == 0:  # NORTH
-                next_row -= 1
-            elif direction == 1:  # EAST
-                next_col += 1
-            elif direction == 2:  # SOUTH
-                next_row += 1
-            elif direction == 3:  # WEST
-                next_col -= 1
-
-            if 0 <= next_row < SIZE and 0 <= next_col < SIZE:
-                if map_state[next_row][next_col] == '#':
-                    direction = (direction + 1) % 4
-                elif depth == 0 and map_state[next_row][next_col] != 'X' and not obstacle_state[next_row][next_col]:
-                    new_map = copy.deepcopy(map_state)
-                    new_dir_map = copy.deepcopy(dir_state)
-                    new_map[next_row][next_col] = '#'
-                    obstacle = solve_recursive(guard_row, guard_col,
-                                               (direction + 1) % 4, 1,
-                                               new_map, new_dir_map,
-                                               obstacle_state)
-                    if obstacle:
-                        obstacle_state[next_row][next_col] = 1
-                        count += 1
-                    guard_row, guard_col = next_row, next_col
-                else:
-                    guard_row, guard_col = next_row, next_col
+            stop = self._stop(cell, d, obstacle)
+            if stop < 0:
+                return False
+            state = stop * 4 + d
+            if seen[state] == stamp:
+                return True
+            seen[state] = stamp
+            cell, d = stop, (d + 1) % 4
+
+    def walk(self):
+        """Yields (cell, direction) for each step of the unobstructed patrol."""
+        width, height, walls = self.width, self.height, self.walls
+        cell, d = self.start, 0
+        states = set()
+        while True:
+            if (cell, d) in states:
+                raise ValueError("The guard never leaves the map")
+            states.add((cell, d))
+            yield cell, d
+            dr, dc = DIRECTION_STEPS[d]
+            r, c = divmod(cell, width)
+            nr, nc = r + dr, c + dc
+            if not (0 <= nr < height and 0 <= nc < width):
+                return
+            if walls[nr * width + nc]:
+                d = (d + 1) % 4
             else:
-                break
+                cell = nr * width + nc
+
+    def candidate_states(self) -> List[Tuple[int, int, int]]:
+        """Returns (obstacle, cell, direction) for each cell on the patrol path.
+
+        An obstacle can only be placed on a cell the first time the guard is
+        about to enter it (before that it would have changed the path), so
+        each candidate is checked from the guard's state just before it.
+        """
+        width, height, walls = self.width, self.height, self.walls
+        visited = {self.start}
+        candidates = []
+        for cell, d in self.walk():
+            dr, dc = DIRECTION_STEPS[d]
+            r, c = divmod(cell, width)
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < height and 0 <= nc < width:
+                ahead = nr * width + nc
+                if not walls[ahead] and ahead not in visited:
+                    visited.add(ahead)
+                    candidates.append((ahead, cell, d))
+        return candidates
+
+    def count_loop_obstacles(self) -> int:
+        """Counts the obstacle positions that trap the guard in a loop."""
+        return sum(1 for obstacle, cell, d in self.candidate_states()
+                   if self.loops_with_obstacle(cell, d, obstacle))
+
+    def share(self) -> shared_memory.SharedMemory:
+        """Publishes the map and jump tables in one shared memory block.
+
+        Layout (int32): width, height, start, then the four jump tables.
+        The caller owns the block and must close() and unlink() it.
+        """
+        header = array('i', [self.width, self.height, self.start])
+        cells = len(self.walls)
+        block = shared_memory.SharedMemory(create=True, size=(len(header) + 4 * cells) * header.itemsize)
+        view = block.buf.cast('i')
+        view[:len(header)] = header
+        for d, table in enumerate(self.jump):
+            offset = len(header) + d * cells
+            view[offset:offset + cells] = array('i', table)
+        view.release()
+        return block
+
+    @classmethod
+    def attach(cls, block: shared_memory.SharedMemory) -> "GuardMap":
+        """Builds a loop checker over a block published by share(), without copying it.
+
+        Only loops_with_obstacle() is available on the result.
+        """
+        view = block.buf.cast('i')
+        guard_map = cls.__new__(cls)
+        guard_map.width, guard_map.height, guard_map.start = view[0], view[1], view[2]
+        cells = guard_map.width * guard_map.height
+        guard_map.walls = None
+        guard_map.jump = [view[3 + d * cells:3 + (d + 1) * cells] for d in range(4)]
+        guard_map._seen = [0] * (cells * 4)
+        guard_map._stamp = 0
+        return guard_map
+
+
+# Per-worker view of the shared map, set up once by _attach_shared_map
+_shared_block = None
+_shared_map = None
+
+
+def _attach_shared_map(name: str) -> None:
+    global _shared_block, _shared_map
+    _shared_block = shared_memory.SharedMemory(name=name)
+    _shared_map = GuardMap.attach(_shared_block)
+
+
+def _count_loops_in_shard(candidates: List[Tuple[int, int, int]]) -> int:
+    return sum(1 for obstacle, cell, d in candidates
+               if _shared_map.loops_with_obstacle(cell, d, obstacle))
+
+
+def count_loop_obstacles_parallel(guard_map: GuardMap, workers: Optional[int] = None,
+                                  shards: Optional[int] = None) -> int:
+    """Counts loop obstacles by sharding the candidates across worker processes.
+
+    The jump tables are published once through shared memory and attached
+    by each worker when it starts, so tasks only carry their candidate list.
+    """
+    candidates = guard_map.candidate_states()
+    if not candidates:
+        return 0
+    workers = workers or os.cpu_count()
+    shards = max(1, min(shards or 4 * workers, len(candidates)))
+    # Interleaved shards spread the long and short loop checks evenly
+    shard_lists = [candidates[i::shards] for i in range(shards)]
+
+    block = guard_map.share()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_map,
+                                 initargs=(block.name,)) as pool:
+            return sum(pool.map(_count_loops_in_shard, shard_lists))
+    finally:
+        block.close()
+        block.unlink()
+
+
+def solve_part_two(filename: str) -> int:
+    """Solves Part Two - Placing obstacles."""
+    with open(filename, "r") as f:
+        rows = [line.strip() for line in f if line.strip()]
+    return GuardMap(rows).count_loop_obstacles()
+
+
+def parse(filename: str) -> Optional[Tuple[Dict[Tuple[int, int], str], int, int]]:
+    """Reads the map for the batch runner."""
+    return generate_map(filename)
+
 
-        return count if depth == 0 else 0
+def solve(map_result: Tuple[Dict[Tuple[int, int], str], int, int], part2: bool = False) -> int:
+    """Returns the visited cell count (part 1) or loop obstacle count (part 2)."""
+    map_data, max_x, max_y = map_result
+    if not part2:
+        return solve_part_one(map_data, max_x, max_y)
 
-    # Solve Part Two
-    return solve_recursive(guard_row, guard_col, 0, 0, map_grid, dir_map, obstacle_map)
+    return GuardMap.from_map_data(map_data, max_x, max_y).count_loop_obstacles()
 
 
 def main():
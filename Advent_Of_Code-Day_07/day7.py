@@ -1,4 +1,4 @@
-from itertools import product
+from functools import lru_cache
 
 
 def evaluate(nums, ops):
@@ -23,14 +23,9 @@ def solve_calibration(filename, include_concatenation=False):
     try:
         with open(filename, 'r') as f:
             for line in f:
-                test_value, nums_str = line.strip().split(':')
-                nums = [int(num) for num in nums_str.split()]
-
-                # Use itertools.product for generating all possible operations combinations
-                for ops in product(ops_set, repeat=len(nums) - 1):
-                    if evaluate(nums, ops) == int(test_value):
-                        total_calibration_result += int(test_value)
-                        break  # Once we find a match, no need to continue checking for this line
+                test_value, nums = parse_equation(line)
+                if is_calibrated(test_value, nums, ops_set):
+                    total_calibration_result += test_value
 
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
@@ -39,15 +34,82 @@ def solve_calibration(filename, include_concatenation=False):
     return total_calibration_result
 
 
-# Example usage (for both parts):
-filename = "input.txt"
+def parse_equation(line):
+    """Splits an equation line into its test value and operands."""
+    test_value, nums_str = line.strip().split(':')
+    return int(test_value), [int(num) for num in nums_str.split()]
+
+
+def digit_modulus(num):
+    """Returns 10 ** (number of decimal digits of num) without a str() round-trip."""
+    modulus = 10
+    while modulus <= num:
+        modulus *= 10
+    return modulus
+
+
+def can_reach(target, nums, last_index, include_concatenation):
+    """Works right to left from the target, undoing the last operator.
+
+    + is undone by subtraction (only while the remainder is non-negative),
+    * by exact division and || by stripping a matching decimal suffix, so
+    impossible branches are cut as soon as they appear. Results are memoized
+    on (target, index), which keeps runs of 1s (where division never prunes)
+    from blowing up exponentially.
+    """
+    @lru_cache(maxsize=None)
+    def reach(target, last_index):
+        num = nums[last_index]
+        if last_index == 0:
+            return target == num
+
+        if num == 0:
+            # Anything times 0 is 0, and adding 0 changes nothing
+            if target == 0 or reach(target, last_index - 1):
+                return True
+        else:
+            if target % num == 0 and reach(target // num, last_index - 1):
+                return True
+            if target >= num and reach(target - num, last_index - 1):
+                return True
+        if include_concatenation:
+            modulus = digit_modulus(num)
+            if target % modulus == num and reach(target // modulus, last_index - 1):
+                return True
+        return False
+
+    return reach(target, last_index)
+
+
+def is_calibrated(test_value, nums, ops_set):
+    """Checks whether any operator combination produces the test value."""
+    # Operands are non-negative, so intermediate results never exceed the target
+    return can_reach(test_value, nums, len(nums) - 1, '||' in ops_set)
+
+
+def parse(filename):
+    """Reads every equation in the file."""
+    with open(filename, 'r') as f:
+        return [parse_equation(line) for line in f if line.strip()]
+
+
+def solve(equations, part2=False):
+    """Sums the test values that can be produced (with || when part2 is set)."""
+    ops_set = ['+', '*'] if not part2 else ['+', '*', '||']
+    return sum(test_value for test_value, nums in equations
+               if is_calibrated(test_value, nums, ops_set))
+
+
+if __name__ == "__main__":
+    # Example usage (for both parts):
+    filename = "input.txt"
 
-# Part One
-result_part_one = solve_calibration(filename)
-if result_part_one is not None:
-    print(f"Total calibration result (Part One): {result_part_one}")
+    # Part One
+    result_part_one = solve_calibration(filename)
+    if result_part_one is not None:
+        print(f"Total calibration result (Part One): {result_part_one}")
 
-# Part Two
-result_part_two = solve_calibration(filename, include_concatenation=True)
-if result_part_two is not None:
-    print(f"Total calibration result (Part Two): {result_part_two}")
\ No newline at end of file
+    # Part Two
+    result_part_two = solve_calibration(filename, include_concatenation=True)
+    if result_part_two is not None:
+        print(f"Total calibration result (Part Two): {result_part_two}")
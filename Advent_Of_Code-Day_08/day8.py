@@ -1,3 +1,7 @@
+from collections import Counter
+from math import gcd
+
+
 def load_antenna_grid_and_locations(document_path: str) -> tuple[list[str], dict[str, list[tuple[int, int]]]]:
     """Load grid and antenna locations from file"""
     with open(document_path, 'r') as file:
@@ -59,9 +63,131 @@ def get_all_anti_nodes(grid: list[str], antenna_locations: dict[str, list[tuple[
     return anti_nodes
 
 
-# Main
-grid, locations = load_antenna_grid_and_locations("input.txt")
-anti_node_pairs = get_all_anti_node_pairs(grid, locations)
-anti_nodes = get_all_anti_nodes(grid, locations)
-print(f"Part 1: {len(anti_node_pairs)}")
-print(f"Part 2: {len(anti_nodes)}")
+def get_line_anti_nodes(
+    antenna_locations: dict[str, list[tuple[int, int]]], rows: int, cols: int
+) -> set[tuple[int, int]]:
+    """Get all anti-nodes by walking each antenna pair's line inside the bounds
+
+    Each line is stepped in gcd-reduced increments, so the cost is proportional
+    to the number of anti-nodes rather than rows * cols * pairs, and only the
+    antenna coordinates and the bounds are needed.
+    """
+    anti_nodes: set[tuple[int, int]] = set()
+    for nodes in antenna_locations.values():
+        for k, n1 in enumerate(nodes):
+            for n2 in nodes[k + 1:]:
+                dr, dc = n2[0] - n1[0], n2[1] - n1[1]
+                divisor = gcd(dr, dc)
+                if divisor == 0:
+                    continue  # Two antennae on the same cell define no line
+                dr, dc = dr // divisor, dc // divisor
+                for step_r, step_c in ((dr, dc), (-dr, -dc)):
+                    r, c = n1
+                    while 0 <= r < rows and 0 <= c < cols:
+                        anti_nodes.add((r, c))
+                        r, c = r + step_r, c + step_c
+    return anti_nodes
+
+
+class AntennaField:
+    """Live anti-node counts under antenna insertions and removals
+
+    Every cell keeps a reference count of the antenna pairs (within one
+    frequency) that put an anti-node on it, separately for part 1 and part 2.
+    Adding or removing an antenna only touches the pairs it belongs to, and
+    the distinct-cell counts are the sizes of the reference-count maps.
+    Part 1 follows get_all_anti_node_pairs: one anti-node per pair, beyond
+    the antenna that comes later in reading order.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        self.antennas: dict[str, set[tuple[int, int]]] = {}
+        self._pair_refs: Counter = Counter()
+        self._line_refs: Counter = Counter()
+
+    @classmethod
+    def from_grid(cls, grid: list[str]) -> "AntennaField":
+        field = cls(len(grid), len(grid[0]) if grid else 0)
+        for r, row in enumerate(grid):
+            for c, char in enumerate(row):
+                if char != ".":
+                    field.add_antenna(char, (r, c))
+        return field
+
+    @property
+    def part1_count(self) -> int:
+        return len(self._pair_refs)
+
+    @property
+    def part2_count(self) -> int:
+        return len(self._line_refs)
+
+    def add_antenna(self, frequency: str, position: tuple[int, int]) -> None:
+        """Add an antenna and the anti-nodes of every pair it forms"""
+        nodes = self.antennas.setdefault(frequency, set())
+        if position in nodes:
+            raise ValueError(f"Antenna {frequency!r} already at {position}")
+        for other in nodes:
+            self._update_pair(other, position, 1)
+        nodes.add(position)
+
+    def remove_antenna(self, frequency: str, position: tuple[int, int]) -> None:
+        """Remove an antenna and the anti-nodes of every pair it formed"""
+        nodes = self.antennas.get(frequency, set())
+        if position not in nodes:
+            raise ValueError(f"No antenna {frequency!r} at {position}")
+        nodes.remove(position)
+        for other in nodes:
+            self._update_pair(other, position, -1)
+
+    def _in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.rows and 0 <= c < self.cols
+
+    def _update_pair(self, n1: tuple[int, int], n2: tuple[int, int], delta: int) -> None:
+        n1, n2 = min(n1, n2), max(n1, n2)
+        dr, dc = n2[0] - n1[0], n2[1] - n1[1]
+        cells = []
+        if self._in_bounds(n2[0] + dr, n2[1] + dc):
+            cells.append((n2[0] + dr, n2[1] + dc))
+        self._apply(self._pair_refs, cells, delta)
+
+        divisor = gcd(dr, dc)
+        dr, dc = dr // divisor, dc // divisor
+        cells = []
+        for step_r, step_c in ((dr, dc), (-dr, -dc)):
+            r, c = n1
+            while self._in_bounds(r, c):
+                cells.append((r, c))
+                r, c = r + step_r, c + step_c
+        self._apply(self._line_refs, cells, delta)
+
+    @staticmethod
+    def _apply(refs: Counter, cells: list[tuple[int, int]], delta: int) -> None:
+        for cell in cells:
+            refs[cell] += delta
+            if not refs[cell]:
+                del refs[cell]
+
+
+def parse(document_path: str) -> tuple[list[str], dict[str, list[tuple[int, int]]]]:
+    """Load grid and antenna locations for the batch runner"""
+    return load_antenna_grid_and_locations(document_path)
+
+
+def solve(data: tuple[list[str], dict[str, list[tuple[int, int]]]], part2: bool = False) -> int:
+    """Count anti-node pairs (part 1) or all anti-nodes (part 2)"""
+    grid, locations = data
+    if part2:
+        return len(get_line_anti_nodes(locations, len(grid), len(grid[0])))
+    return len(get_all_anti_node_pairs(grid, locations))
+
+
+if __name__ == "__main__":
+    # Main
+    grid, locations = load_antenna_grid_and_locations("input.txt")
+    anti_node_pairs = get_all_anti_node_pairs(grid, locations)
+    anti_nodes = get_all_anti_nodes(grid, locations)
+    print(f"Part 1: {len(anti_node_pairs)}")
+    print(f"Part 2: {len(anti_nodes)}")
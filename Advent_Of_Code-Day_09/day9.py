@@ -1,60 +1,131 @@
-def solve(disk_map, part2=False):
-    # Initialize data structures
-    A = []  # File blocks
-    SPACE = []  # Free space blocks
-    FINAL = []  # Final disk layout
-    file_id = 0
+import heapq
+import mmap
+from array import array
+
+
+def span_checksum(file_id, start, length):
+    """Checksum contribution of `length` blocks of `file_id` starting at `start`."""
+    return file_id * (start * length + length * (length - 1) // 2)
+
+
+def compact_blocks(sizes):
+    """Part 1 checksum: move single blocks from the back into the leftmost free space.
+
+    `sizes` is the disk map as a sequence of digits. A front pointer walks the
+    map left to right while a back pointer hands out the blocks of the last
+    file not yet moved, so nothing but the two pointers is kept.
+    """
+    back = len(sizes) - 1
+    if back % 2:
+        back -= 1  # A trailing free-space entry holds no file
+    back_left = sizes[back] if back >= 0 else 0
+
+    checksum = 0
     pos = 0
+    front = 0
+    while front <= back:
+        if front % 2 == 0:
+            length = back_left if front == back else sizes[front]
+            checksum += span_checksum(front // 2, pos, length)
+            pos += length
+        else:
+            gap = sizes[front]
+            while gap and back > front:
+                take = min(gap, back_left)
+                checksum += span_checksum(back // 2, pos, take)
+                pos += take
+                gap -= take
+                back_left -= take
+                if not back_left:
+                    back -= 2
+                    back_left = sizes[back] if back > front else 0
+        front += 1
+    return checksum
+
+
+class DigitFile:
+    """Read-only digit sequence over a memory-mapped disk map file."""
+
+    def __init__(self, mapped):
+        self.mapped = mapped
+        self.length = len(mapped)
+        while self.length and not mapped[self.length - 1:self.length].isdigit():
+            self.length -= 1  # Drop the trailing newline
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self.mapped[index] - 48
+
+
+def compact_blocks_file(filename):
+    """Part 1 checksum of a disk map file using constant extra memory.
 
-    # Parse the input disk map
-    for i, c in enumerate(disk_map):
+    The file is memory-mapped and fed to compact_blocks digit by digit, so
+    disk maps larger than RAM only cost the pages currently being read.
+    """
+    with open(filename, 'rb') as file:
+        if not file.seek(0, 2):
+            return 0  # mmap cannot map an empty file
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return compact_blocks(DigitFile(mapped))
+
+
+def compact_files(sizes):
+    """Part 2 checksum: move whole files, highest id first, into the leftmost gap that fits.
+
+    Free gaps are kept as start positions in nine min-heaps, one per gap
+    length. The leftmost fitting gap is the smallest heap top among the heaps
+    for lengths >= the file size; what is left of a used gap is pushed back
+    into the heap for its new length.
+    """
+    file_starts = array("q")
+    gaps = [[] for _ in range(10)]
+    pos = 0
+    for i, size in enumerate(sizes):
         if i % 2 == 0:
-            # File block
-            if part2:
-                A.append((pos, int(c), file_id))
-
-            # Add file blocks to FINAL
-            for _ in range(int(c)):
-                FINAL.append(file_id)
-                if not part2:
-                    A.append((pos, 1, file_id))
-                pos += 1
-
-            file_id += 1
-        else:
-            # Free space block
-            SPACE.append((pos, int(c)))
-            for _ in range(int(c)):
-                FINAL.append(None)
-                pos += 1
-
-    # Compact files
-    for (pos, sz, file_id) in reversed(A):
-        for space_i, (space_pos, space_sz) in enumerate(SPACE):
-            # Find suitable free space
-            if space_pos < pos and sz <= space_sz:
-                # Move file block
-                for i in range(sz):
-                    assert FINAL[pos + i] == file_id, f'Unexpected file block at {pos + i}'
-                    FINAL[pos + i] = None
-                    FINAL[space_pos + i] = file_id
-
-                # Update free space
-                SPACE[space_i] = (space_pos + sz, space_sz - sz)
-                break
-
-    # Calculate checksum
-    ans = sum(i * c for i, c in enumerate(FINAL) if c is not None)
-    return ans
-
-
-# Read input from file
-with open('input.txt', 'r') as file:
-    disk_map = file.read().strip()
-
-# Calculate both parts
-part1 = solve(disk_map, part2=False)
-part2 = solve(disk_map, part2=True)
-
-print(f"Part 1 Checksum: {part1}")
-print(f"Part 2 Checksum: {part2}")
\ No newline at end of file
+            file_starts.append(pos)
+        elif size:
+            gaps[size].append(pos)
+        pos += size
+    # Gap starts were appended in increasing order, so every list is already a heap
+
+    checksum = 0
+    for file_id in range(len(file_starts) - 1, -1, -1):
+        start = file_starts[file_id]
+        size = sizes[2 * file_id]
+        best_length = None
+        for length in range(size, 10):
+            heap = gaps[length]
+            if heap and heap[0] < start and (best_length is None or heap[0] < gaps[best_length][0]):
+                best_length = length
+        if best_length is not None:
+            gap_start = heapq.heappop(gaps[best_length])
+            if best_length > size:
+                heapq.heappush(gaps[best_length - size], gap_start + size)
+            start = gap_start
+        checksum += span_checksum(file_id, start, size)
+    return checksum
+
+
+def solve(disk_map, part2=False):
+    sizes = [int(c) for c in disk_map]
+    return compact_files(sizes) if part2 else compact_blocks(sizes)
+
+
+def parse(filename):
+    # Read input from file
+    with open(filename, 'r') as file:
+        return file.read().strip()
+
+
+if __name__ == "__main__":
+    disk_map = parse('input.txt')
+
+    # Calculate both parts
+    part1 = solve(disk_map, part2=False)
+    part2 = solve(disk_map, part2=True)
+
+    print(f"Part 1 Checksum: {part1}")
+    print(f"Part 2 Checksum: {part2}")
@@ -67,22 +67,151 @@ def bfs_part2(height_map, start):
     return len(trails)
 
 
+NEIGHBOURS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def layered_trail_counts(height_map):
+    """
+    Sweep heights 9 down to 0 once over the whole map.
+
+    Returns two flat per-cell lists (indexed r * cols + c): a bitset of the
+    9s reachable from the cell (one bit per 9, as a Python int) and the
+    number of distinct trails from the cell to any 9. A cell's values are
+    the union/sum over its neighbours one height above, which are already
+    final when its layer is processed.
+    """
+    rows, cols = len(height_map), len(height_map[0])
+    layers = [[] for _ in range(10)]
+    for r, row in enumerate(height_map):
+        for c, value in enumerate(row):
+            layers[value].append((r, c))
+
+    summits = [0] * (rows * cols)
+    trails = [0] * (rows * cols)
+    for bit, (r, c) in enumerate(layers[9]):
+        summits[r * cols + c] = 1 << bit
+        trails[r * cols + c] = 1
+
+    for height in range(8, -1, -1):
+        for r, c in layers[height]:
+            reachable = count = 0
+            for dr, dc in NEIGHBOURS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and height_map[nr][nc] == height + 1:
+                    reachable |= summits[nr * cols + nc]
+                    count += trails[nr * cols + nc]
+            summits[r * cols + c] = reachable
+            trails[r * cols + c] = count
+    return summits, trails
+
+
+def trailhead_metrics(height_map):
+    """
+    Map every trailhead to its (score, rating) from a single layered sweep.
+    """
+    cols = len(height_map[0])
+    summits, trails = layered_trail_counts(height_map)
+    return {
+        (r, c): (bin(summits[r * cols + c]).count("1"), trails[r * cols + c])
+        for r, c in find_trailheads(height_map)
+    }
+
+
 def part1(height_map):
-    trailheads = find_trailheads(height_map)
-    total_score = 0
-    for trailhead in trailheads:
-        score = bfs_part1(height_map, trailhead)
-        total_score += score
-    return total_score
+    return sum(score for score, _ in trailhead_metrics(height_map).values())
 
 
 def part2(height_map):
-    trailheads = find_trailheads(height_map)
-    total_rating = 0
-    for trailhead in trailheads:
-        rating = bfs_part2(height_map, trailhead)
-        total_rating += rating
-    return total_rating
+    return sum(rating for _, rating in trailhead_metrics(height_map).values())
+
+
+class TrailMap:
+    """
+    Height map that keeps trail metrics up to date under single-cell edits.
+
+    Every cell stores a bitset of reachable 9s (bit r * cols + c marks the 9
+    at (r, c)) and its number of distinct trails. A cell's values only depend
+    on its neighbours one height above, so an edit can only change the edited
+    cell and the cells below it that lead up to it, before or after the edit.
+    set_height recomputes just that cone, highest first.
+    """
+
+    def __init__(self, height_map):
+        self.height_map = [list(row) for row in height_map]
+        self.rows, self.cols = len(height_map), len(height_map[0])
+        self.summits = [0] * (self.rows * self.cols)
+        self.trails = [0] * (self.rows * self.cols)
+        self.total_score = 0
+        self.total_rating = 0
+        cells = [(r, c) for r in range(self.rows) for c in range(self.cols)]
+        self._refresh(cells)
+
+    def _neighbours(self, r, c, height):
+        for dr, dc in NEIGHBOURS:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and self.height_map[nr][nc] == height:
+                yield nr, nc
+
+    def _cone_below(self, r, c):
+        """Cells with a trail segment leading up to (r, c), including itself."""
+        cone = {(r, c)}
+        queue = deque(cone)
+        while queue:
+            r, c = queue.popleft()
+            for cell in self._neighbours(r, c, self.height_map[r][c] - 1):
+                if cell not in cone:
+                    cone.add(cell)
+                    queue.append(cell)
+        return cone
+
+    def _refresh(self, cells):
+        """Recomputes the given cells, highest first, and adds trailheads to the totals."""
+        for r, c in sorted(cells, key=lambda cell: -self.height_map[cell[0]][cell[1]]):
+            index = r * self.cols + c
+            height = self.height_map[r][c]
+            if height == 9:
+                reachable, count = 1 << index, 1
+            else:
+                reachable = count = 0
+                for nr, nc in self._neighbours(r, c, height + 1):
+                    reachable |= self.summits[nr * self.cols + nc]
+                    count += self.trails[nr * self.cols + nc]
+            self.summits[index] = reachable
+            self.trails[index] = count
+            if height == 0:
+                self.total_score += bin(reachable).count("1")
+                self.total_rating += count
+
+    def set_height(self, r, c, height):
+        """
+        Changes one cell's height and returns the updated (total score, total rating).
+        """
+        old_height = self.height_map[r][c]
+        affected = self._cone_below(r, c)
+        self.height_map[r][c] = height
+        affected |= self._cone_below(r, c)
+
+        for cr, cc in affected:
+            before = old_height if (cr, cc) == (r, c) else self.height_map[cr][cc]
+            if before == 0:
+                index = cr * self.cols + cc
+                self.total_score -= bin(self.summits[index]).count("1")
+                self.total_rating -= self.trails[index]
+        self._refresh(affected)
+        return self.total_score, self.total_rating
+
+
+_part2 = part2
+
+
+def parse(file_path):
+    return parse_input(file_path)
+
+
+def solve(height_map, part2=False):
+    if part2:
+        return _part2(height_map)
+    return part1(height_map)
 
 
 def main(file_path):
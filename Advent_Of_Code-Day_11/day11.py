@@ -1,41 +1,236 @@
+from bisect import bisect_right
 from collections import defaultdict
+from functools import lru_cache
 
 def solve_plutonian_pebbles_optimized(filename, num_blinks):
     """Simulates Plutonian pebble evolution (optimized for many blinks)."""
     try:
-        with open(filename, 'r') as f:
-            initial_stones = [int(s) for s in f.read().strip().split()]
+        initial_stones = parse(filename)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
 
-    stone_counts = defaultdict(int)
-    for stone in initial_stones:
-        stone_counts[stone] += 1
-
-    for _ in range(num_blinks):
-        new_stone_counts = defaultdict(int)
-        for stone, count in stone_counts.items():
-            if stone == 0:
-                new_stone_counts[1] += count
-            elif len(str(stone)) % 2 == 0:
-                s = str(stone)
-                mid = len(s) // 2
-                new_stone_counts[int(s[:mid])] += count
-                new_stone_counts[int(s[mid:])] += count
-            else:
-                new_stone_counts[stone * 2024] += count
-        stone_counts = new_stone_counts
-
-    total_stones = sum(stone_counts.values())
-    return total_stones
-
-# Example usage:
-filename = "input.txt"
-
-num_stones_25_blinks = solve_plutonian_pebbles_optimized(filename, 25)
-num_stones_75_blinks = solve_plutonian_pebbles_optimized(filename, 75)
-if num_stones_25_blinks is not None:
-    print(f"Number of stones after 25 blinks: {num_stones_25_blinks}")
-if num_stones_75_blinks is not None:
-    print(f"Number of stones after 75 blinks: {num_stones_75_blinks}")
\ No newline at end of file
+    return count_stones(initial_stones, num_blinks)
+
+
+def parse(filename):
+    """Reads the initial stone engravings."""
+    with open(filename, 'r') as f:
+        return [int(s) for s in f.read().strip().split()]
+
+
+MEMO_SIZE = 1 << 16
+POWERS_OF_TEN = [10 ** k for k in range(64)]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def blink_stone(stone):
+    """Returns the stones a single engraving turns into after one blink."""
+    if stone == 0:
+        return (1,)
+    digits = bisect_right(POWERS_OF_TEN, stone)
+    if digits == len(POWERS_OF_TEN):
+        digits = len(str(stone))  # Beyond the table, fall back to counting characters
+    if digits % 2 == 0:
+        half = digits // 2
+        return divmod(stone, POWERS_OF_TEN[half] if half < len(POWERS_OF_TEN) else 10 ** half)
+    return (stone * 2024,)
+
+
+class BlinkEngine:
+    """Advances grouped stone counts and reports totals at several checkpoints."""
+
+    def __init__(self, initial_stones):
+        self.stone_counts = defaultdict(int)
+        for stone in initial_stones:
+            self.stone_counts[stone] += 1
+
+    @classmethod
+    def from_file(cls, filename):
+        return cls(parse(filename))
+
+    def counts(self, checkpoints):
+        """Maps each blink checkpoint to the number of stones, in one forward pass."""
+        wanted = set(checkpoints)
+        last = max(wanted, default=0)
+        stone_counts = self.stone_counts
+        results = {}
+        for blink in range(last + 1):
+            if blink in wanted:
+                results[blink] = sum(stone_counts.values())
+            if blink == last:
+                break
+            new_stone_counts = defaultdict(int)
+            for stone, count in stone_counts.items():
+                for new_stone in blink_stone(stone):
+                    new_stone_counts[new_stone] += count
+            stone_counts = new_stone_counts
+        return results
+
+
+def count_stones(initial_stones, num_blinks):
+    """Counts the stones after num_blinks blinks, grouping equal engravings."""
+    return BlinkEngine(initial_stones).counts([num_blinks])[num_blinks]
+
+DEFAULT_MODULUS = (1 << 61) - 1  # A Mersenne prime
+
+
+def berlekamp_massey(sequence, modulus):
+    """Shortest recurrence s[n] = -(c[1] s[n-1] + ... + c[L] s[n-L]) mod a prime, as [1, c1, ..., cL]."""
+    current, previous = [1], [1]
+    length, gap, last_discrepancy = 0, 1, 1
+    for n, term in enumerate(sequence):
+        discrepancy = term
+        for i in range(1, length + 1):
+            discrepancy += current[i] * sequence[n - i]
+        discrepancy %= modulus
+        if not discrepancy:
+            gap += 1
+            continue
+        factor = discrepancy * pow(last_discrepancy, -1, modulus) % modulus
+        saved = current[:]
+        current += [0] * (len(previous) + gap - len(current))
+        for i, coefficient in enumerate(previous):
+            current[i + gap] = (current[i + gap] - factor * coefficient) % modulus
+        if 2 * length <= n:
+            length, previous, last_discrepancy, gap = n + 1 - length, saved, discrepancy, 1
+        else:
+            gap += 1
+    return current[:length + 1] + [0] * (length + 1 - len(current))
+
+
+def _poly_mul(a, b, modulus):
+    """Multiplies coefficient lists modulo a number through one big-integer product."""
+    if not a or not b:
+        return []
+    slot = (2 * modulus.bit_length() + min(len(a), len(b)).bit_length() + 7) // 8
+    packed_a = int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in a), "little")
+    packed_b = int.from_bytes(b"".join(c.to_bytes(slot, "little") for c in b), "little")
+    size = len(a) + len(b) - 1
+    product = (packed_a * packed_b).to_bytes(size * slot, "little")
+    return [int.from_bytes(product[i:i + slot], "little") % modulus for i in range(0, size * slot, slot)]
+
+
+def _poly_inverse(a, terms, modulus):
+    """Power series inverse of a (with a[0] invertible) modulo x**terms, by Newton iteration."""
+    inverse = [pow(a[0], -1, modulus)]
+    while len(inverse) < terms:
+        size = min(2 * len(inverse), terms)
+        error = _poly_mul(a[:size], inverse, modulus)[:size]
+        # g <- g * (2 - a * g), doubling the number of correct terms
+        correction = _poly_mul(inverse, [(-c) % modulus for c in error], modulus)[:size]
+        inverse = [(c + 2 * g) % modulus for c, g in zip(correction, inverse + [0] * size)]
+    return inverse
+
+
+class _PolyModulus:
+    """Reduces polynomials modulo a fixed monic polynomial, Barrett style."""
+
+    def __init__(self, monic, modulus):
+        self.monic = monic
+        self.degree = len(monic) - 1
+        self.modulus = modulus
+        self.reversed_inverse = _poly_inverse(monic[::-1], max(self.degree - 1, 1), modulus)
+
+    def reduce(self, a):
+        degree, modulus = self.degree, self.modulus
+        if len(a) <= degree:
+            return a + [0] * (degree - len(a))
+        quotient_terms = len(a) - degree
+        quotient = _poly_mul(a[::-1][:quotient_terms], self.reversed_inverse[:quotient_terms], modulus)
+        quotient = quotient[:quotient_terms][::-1]
+        product = _poly_mul(quotient, self.monic, modulus)
+        return [(a[i] - product[i]) % modulus for i in range(degree)]
+
+    def power_of_x(self, exponent):
+        """x**exponent reduced modulo the polynomial, by repeated squaring."""
+        result = self.reduce([1])
+        for bit in bin(exponent)[2:]:
+            result = self.reduce(_poly_mul(result, result, self.modulus))
+            if bit == "1":
+                result = self.reduce([0] + result)
+        return result
+
+
+class StoneClosure:
+    """
+    Closed set of engravings reachable from the initial stones, with its transitions.
+
+    Blinking maps each value to one or two values of the same finite set, so
+    the stone counts evolve by a sparse transition matrix. The total after n
+    blinks then satisfies a linear recurrence of order at most the size of
+    the set, and count_after jumps to any blink count by repeated squaring of
+    x modulo that recurrence's characteristic polynomial.
+    """
+
+    def __init__(self, initial_stones):
+        values = set(initial_stones)
+        pending = list(values)
+        while pending:
+            for new_stone in blink_stone(pending.pop()):
+                if new_stone not in values:
+                    values.add(new_stone)
+                    pending.append(new_stone)
+        self.values = sorted(values)
+        self.index = {value: i for i, value in enumerate(self.values)}
+        self.transitions = [tuple(self.index[s] for s in blink_stone(value)) for value in self.values]
+        self.initial = [0] * len(self.values)
+        for stone in initial_stones:
+            self.initial[self.index[stone]] += 1
+        self._recurrences = {}
+
+    def totals(self, num_terms, modulus=None):
+        """Stone totals after 0 .. num_terms - 1 blinks, exact or modulo a number."""
+        counts = self.initial
+        totals = []
+        for _ in range(num_terms):
+            totals.append(sum(counts) if modulus is None else sum(counts) % modulus)
+            new_counts = [0] * len(counts)
+            for i, count in enumerate(counts):
+                if count:
+                    for j in self.transitions[i]:
+                        new_counts[j] += count
+            counts = new_counts if modulus is None else [count % modulus for count in new_counts]
+        return totals
+
+    def count_after(self, num_blinks, modulus=DEFAULT_MODULUS):
+        """
+        Number of stones after num_blinks blinks modulo a prime, in O(log num_blinks) products.
+
+        With modulus=None the exact count is computed blink by blink instead;
+        its digits grow linearly with num_blinks, so no shortcut exists there.
+        """
+        if modulus is None or (num_blinks < 2 * len(self.values) and modulus not in self._recurrences):
+            return self.totals(num_blinks + 1, modulus)[-1]
+        if modulus not in self._recurrences:
+            # The recurrence order is at most the number of values, so twice as many terms pin it down
+            terms = self.totals(2 * len(self.values), modulus)
+            recurrence = berlekamp_massey(terms, modulus)
+            self._recurrences[modulus] = terms, _PolyModulus(recurrence[::-1], modulus)
+        terms, polynomial = self._recurrences[modulus]
+        if num_blinks < len(terms):
+            return terms[num_blinks]
+        if not polynomial.degree:
+            return 0
+        coefficients = polynomial.power_of_x(num_blinks)
+        return sum(c * t for c, t in zip(coefficients, terms)) % modulus
+
+
+def solve(initial_stones, part2=False):
+    """Counts the stones after 25 (part 1) or 75 (part 2) blinks."""
+    return count_stones(initial_stones, 75 if part2 else 25)
+
+
+if __name__ == "__main__":
+    # Example usage:
+    filename = "input.txt"
+
+    try:
+        engine = BlinkEngine.from_file(filename)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+    else:
+        # Both answers come out of the same 75-blink pass
+        counts = engine.counts([25, 75])
+        print(f"Number of stones after 25 blinks: {counts[25]}")
+        print(f"Number of stones after 75 blinks: {counts[75]}")
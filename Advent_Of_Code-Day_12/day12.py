@@ -1,5 +1,7 @@
 import sys
+from array import array
 from itertools import product
+from typing import Iterable, Iterator, NamedTuple
 
 # Constants
 DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
@@ -101,11 +103,223 @@ class Field:
         return sum(region.side_price() for region in self.regions)
 
 
+def cell_shape(up: bytes, row: bytes, down: bytes) -> tuple[list[int], list[int]]:
+    """Perimeter and corner contributions of every cell in `row`.
+
+    `up` and `down` are the neighbouring rows (zero bytes outside the map).
+    Each comparison is done on whole rows shifted by one cell, the same
+    checks CORNER_PATTERNS makes on a 3x3 neighbourhood.
+    """
+    pad = b"\0"
+    left, right = pad + row[:-1], row[1:] + pad
+    up_left, up_right = pad + up[:-1], up[1:] + pad
+    down_left, down_right = pad + down[:-1], down[1:] + pad
+
+    perimeters, corners = [], []
+    for plant, u, d, l, r, ul, ur, dl, dr in zip(
+        row, up, down, left, right, up_left, up_right, down_left, down_right
+    ):
+        u, d, l, r = u == plant, d == plant, l == plant, r == plant
+        perimeters.append(4 - u - d - l - r)
+        corners.append(
+            (not (u or l) or (u and l and ul != plant))
+            + (not (u or r) or (u and r and ur != plant))
+            + (not (d or l) or (d and l and dl != plant))
+            + (not (d or r) or (d and r and dr != plant))
+        )
+    return perimeters, corners
+
+
+class LabeledField:
+    """Region statistics over a flat label grid instead of per-region position sets.
+
+    The map is kept as one bytearray and regions are labelled with a two-pass
+    union-find scan into an int32 array. Area, perimeter and corner counts per
+    label are then accumulated row by row from shifted-row comparisons.
+    """
+
+    def __init__(self, field_map: list[str]) -> None:
+        self._rows, self._cols = len(field_map), len(field_map[0])
+        self.grid = bytearray("".join(field_map).encode())
+        self.labels = self._label()
+        self.count = max(self.labels, default=-1) + 1
+        self.areas = array("q", bytes(8 * self.count))
+        self.perimeters = array("q", bytes(8 * self.count))
+        self.corners = array("q", bytes(8 * self.count))
+        self._measure()
+
+    def _row(self, row: int) -> bytes:
+        if not 0 <= row < self._rows:
+            return bytes(self._cols)
+        return bytes(self.grid[row * self._cols:(row + 1) * self._cols])
+
+    def _label(self) -> array:
+        grid, cols = self.grid, self._cols
+        labels = array("i", bytes(4 * len(grid)))
+        parent = array("i")
+
+        def find(label: int) -> int:
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        for index, plant in enumerate(grid):
+            up_same = index >= cols and grid[index - cols] == plant
+            left_same = index % cols and grid[index - 1] == plant
+            if up_same:
+                label = labels[index - cols]
+                if left_same:
+                    root, other = find(label), find(labels[index - 1])
+                    if root != other:
+                        parent[max(root, other)] = min(root, other)
+            elif left_same:
+                label = labels[index - 1]
+            else:
+                label = len(parent)
+                parent.append(label)
+            labels[index] = label
+
+        compact = array("i", bytes(4 * len(parent)))
+        count = 0
+        for label in range(len(parent)):
+            root = find(label)
+            if root == label:
+                compact[label] = count
+                count += 1
+            else:
+                compact[label] = compact[root]  # Roots are always smaller than their members
+        for index, label in enumerate(labels):
+            labels[index] = compact[label]
+        return labels
+
+    def _measure(self) -> None:
+        cols = self._cols
+        for row in range(self._rows):
+            perimeters, corners = cell_shape(self._row(row - 1), self._row(row), self._row(row + 1))
+            row_labels = self.labels[row * cols:(row + 1) * cols]
+            for label, perimeter, corner_count in zip(row_labels, perimeters, corners):
+                self.areas[label] += 1
+                self.perimeters[label] += perimeter
+                self.corners[label] += corner_count
+
+    def price(self) -> int:
+        return sum(area * perimeter for area, perimeter in zip(self.areas, self.perimeters))
+
+    def bulk_price(self) -> int:
+        return sum(area * corners for area, corners in zip(self.areas, self.corners))
+
+
+class RegionStats(NamedTuple):
+    plant: str
+    area: int
+    perimeter: int
+    corners: int
+
+
+def stream_regions(rows: Iterable[str]) -> Iterator[RegionStats]:
+    """Yields every region of a map given row by row, as soon as it is complete.
+
+    Only the previous, current and next rows are kept. Regions are labelled
+    with a two-row union-find: each row's cells join the labels of the cells
+    above and to the left. A row's shape counts are added once the row below
+    it is known, and a region no longer present in the newest row is yielded.
+    """
+    parent: dict[int, int] = {}
+    stats: dict[int, list[int]] = {}
+
+    def find(label: int) -> int:
+        root = label
+        while parent[root] != root:
+            root = parent[root]
+        while parent[label] != root:
+            parent[label], label = root, parent[label]
+        return root
+
+    def union(a: int, b: int) -> int:
+        a, b = find(a), find(b)
+        if a != b:
+            parent[b] = a
+            if b in stats:
+                merged = stats.setdefault(a, [0, 0, 0])
+                for i, value in enumerate(stats.pop(b)):
+                    merged[i] += value
+        return a
+
+    above, prev, prev_labels = b"", b"", []
+    next_label = 0
+    for line in rows:
+        row = line.encode()
+        if not prev:
+            above = prev = bytes(len(row))
+        labels = []
+        for col, plant in enumerate(row):
+            label = None
+            if prev[col] == plant:
+                label = find(prev_labels[col])
+            if col and row[col - 1] == plant:
+                label = labels[col - 1] if label is None else union(labels[col - 1], label)
+            if label is None:
+                label, next_label = next_label, next_label + 1
+                parent[label] = label
+            labels.append(label)
+
+        labels = [find(label) for label in labels]
+        yield from _close_row(above, prev, row, prev_labels, labels, find, stats, parent)
+        above, prev, prev_labels = prev, row, labels
+
+    if prev_labels:
+        yield from _close_row(above, prev, bytes(len(prev)), prev_labels, [], find, stats, parent)
+
+
+def _close_row(above: bytes, prev: bytes, row: bytes, prev_labels: list[int], labels: list[int],
+               find, stats: dict[int, list[int]], parent: dict[int, int]) -> Iterator[RegionStats]:
+    """Adds the previous row's shape counts and yields the regions that stopped growing."""
+    if prev_labels:
+        perimeters, corners = cell_shape(above, prev, row)
+        for col, label in enumerate(prev_labels):
+            counts = stats.setdefault(find(label), [0, 0, 0])
+            counts[0] += 1
+            counts[1] += perimeters[col]
+            counts[2] += corners[col]
+
+    live = set(labels)  # The newest row arrives with its labels resolved to roots
+    plants = {find(label): chr(plant) for label, plant in zip(prev_labels, prev)}
+    for root, plant in plants.items():
+        if root not in live:
+            yield RegionStats(plant, *stats.pop(root))
+
+    # Only the roots of the newest row are looked up again, so the forest stays O(width)
+    parent.clear()
+    parent.update((root, root) for root in live)
+
+
+def stream_price(file_name: str) -> tuple[int, int]:
+    """Price and bulk price of a map file read one row at a time."""
+    price = bulk_price = 0
+    with open(file_name, 'r') as file:
+        rows = (line.rstrip("\n") for line in file)
+        for region in stream_regions(row for row in rows if row):
+            price += region.area * region.perimeter
+            bulk_price += region.area * region.corners
+    return price, bulk_price
+
+
+def parse(file_name: str) -> list[str]:
+    with open(file_name, 'r') as file:
+        return file.read().strip().split("\n")
+
+
+def solve(field_map: list[str], part2: bool = False) -> int:
+    field = LabeledField(field_map)
+    return field.bulk_price() if part2 else field.price()
+
+
 def main(file_name: str = "input.txt") -> None:
     try:
         with open(file_name, 'r') as file:
             field_map = file.read().strip().split("\n")
-        field = Field(field_map)
+        field = LabeledField(field_map)
 
         print(f"The total price of the field is {field.price()}")
         print(f"With the bulk discount, the price is {field.bulk_price()}")
@@ -27,20 +27,33 @@ def calc_linear_combination(px, py, ax, ay, bx, by):
     return 0
 
 
-def main():
-    with open("input.txt", "r") as f:
+def parse(filename):
+    """
+    Read every claw machine as an (ax, ay, bx, by, px, py) tuple.
+    """
+    with open(filename, "r") as f:
         input_text = f.read()
 
     pattern = r"Button A: X\+(\d+), Y\+(\d+)\s+Button B: X\+(\d+), Y\+(\d+)\s+Prize: X=(\d+), Y=(\d+)"
     regex = re.compile(pattern)
+    return [tuple(map(int, match.groups())) for match in regex.finditer(input_text)]
+
+
+def solve(machines, part2=False):
+    """
+    Sum the minimal token cost over all machines (prizes shifted for part 2).
+    """
+    offset = 10000000000000 if part2 else 0
+    return sum(calc_linear_combination(px + offset, py + offset, ax, ay, bx, by)
+               for ax, ay, bx, by, px, py in machines)
+
 
+def main():
     part_1 = 0
     part_2 = 0
 
-    # Iterate over matches and extract data
-    for match in regex.finditer(input_text):
-        ax, ay, bx, by, px, py = map(int, match.groups())
-
+    # Iterate over machines
+    for ax, ay, bx, by, px, py in parse("input.txt"):
         part_1 += calc_linear_combination(px, py, ax, ay, bx, by)
         part_2 += calc_linear_combination(px + 10000000000000, py + 10000000000000, ax, ay, bx, by)
 
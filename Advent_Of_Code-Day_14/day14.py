@@ -94,6 +94,19 @@ def solve_part_2(robots, grid_width, grid_height):
     return -1  # If no Easter egg moment found
 
 
+def parse(filename):
+    with open(filename, 'r') as file:
+        return parse_input(file.read().strip())
+
+
+def solve(robots, part2=False):
+    # Grid dimensions
+    grid_width, grid_height = 101, 103
+    if part2:
+        return solve_part_2(robots, grid_width, grid_height)
+    return solve_part_1(robots, grid_width, grid_height)
+
+
 def main():
     # Read input from file
     with open('input.txt', 'r') as file:
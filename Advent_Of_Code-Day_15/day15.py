@@ -167,9 +167,23 @@ def solve_part2(input_file):
     return calculate_wide_gps_sum(final_wide_warehouse)
 
 
-input_file = "input.txt"
-part1_answer = solve_part1(input_file)
-part2_answer = solve_part2(input_file)
+def parse(input_file):
+    return parse_warehouse_and_instructions(read_input(input_file))
 
-print(f"Part 1 answer: {part1_answer}")
-print(f"Part 2 answer: {part2_answer}")
\ No newline at end of file
+
+def solve(parsed, part2=False):
+    warehouse, instructions = parsed
+    warehouse = [row[:] for row in warehouse]  # Simulations move cells in place
+    if part2:
+        wide_warehouse = expand_warehouse(warehouse)
+        return calculate_wide_gps_sum(simulate_wide_robot_movement(wide_warehouse, instructions))
+    return calculate_gps_sum(simulate_robot_movement(warehouse, instructions))
+
+
+if __name__ == "__main__":
+    input_file = "input.txt"
+    part1_answer = solve_part1(input_file)
+    part2_answer = solve_part2(input_file)
+
+    print(f"Part 1 answer: {part1_answer}")
+    print(f"Part 2 answer: {part2_answer}")
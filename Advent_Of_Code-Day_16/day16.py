@@ -65,6 +65,10 @@ def part_a(min_costs, end_r, end_c):
 
 
 def part_b(min_costs, grid, end_r, end_c):
+    print(f"Number of tiles on optimal paths: {count_optimal_tiles(min_costs, grid, end_r, end_c)}")
+
+
+def count_optimal_tiles(min_costs, grid, end_r, end_c):
     rows, cols = len(grid), len(grid[0])
     directions = {0: (-1, 0), 1: (0, 1), 2: (1, 0), 3: (0, -1)}
 
@@ -104,7 +108,18 @@ def part_b(min_costs, grid, end_r, end_c):
             if min_costs[prev_r][prev_c][prev_d] + 1000 == min_costs[r][c][d]:
                 queue.append((prev_r, prev_c, prev_d))
 
-    print(f"Number of tiles on optimal paths: {len(optimal_positions)}")
+    return len(optimal_positions)
+
+
+def parse(filename):
+    return read_grid(filename)
+
+
+def solve(grid, part2=False):
+    min_costs, end_r, end_c = dijkstra(grid)
+    if part2:
+        return count_optimal_tiles(min_costs, grid, end_r, end_c)
+    return min(min_costs[end_r][end_c])
 
 
 def main():
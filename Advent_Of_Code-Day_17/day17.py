@@ -78,14 +78,20 @@ class Computer:
 
 def part1(program, registers):
     """Solves Part 1: Executes the program and prints its output."""
-    comp = Computer(program, registers)
-    result = comp.run()
+    result = Computer(program, registers).run()
     print("Part 1 Output:", result)
     return result
 
 
 def part2(program):
     """Solves Part 2: Finds the lowest value for register A that outputs a copy of the program."""
+    a = find_quine_register(program)
+    print("Part 2 Result:", a)
+    return a
+
+
+def find_quine_register(program):
+    """Finds the lowest value for register A that makes the program output itself."""
     def run_program(a, b, c):
         "Runs the program with the specified initial registers and returns the output."
         comp = Computer(program, {'A': a, 'B': b, 'C': c})
@@ -98,10 +104,22 @@ def part2(program):
             if run_program(a, 0, 0) == program[-i:]:
                 todo.append((i + 1, a * 8))
                 if i == len(program):
-                    print("Part 2 Result:", a)
                     return a
 
 
+def parse(file_path):
+    """Reads the registers and program for the batch runner."""
+    return read_input(file_path)
+
+
+def solve(data, part2=False):
+    """Returns the program output (part 1) or the self-replicating A (part 2)."""
+    registers, program = data
+    if part2:
+        return find_quine_register(program)
+    return Computer(program, registers).run()
+
+
 def main(file_path):
     registers, program = read_input(file_path)
     # Solve Part 1
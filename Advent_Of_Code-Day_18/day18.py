@@ -65,6 +65,19 @@ def find_first_blocking_byte(byte_positions):
     return "No blocking byte found"
 
 
+def parse(filename):
+    """Load all byte positions for the batch runner"""
+    return load_byte_positions(filename)
+
+
+def solve(byte_positions, part2=False):
+    """Shortest path after 1024 bytes (part 1) or first blocking byte (part 2)"""
+    if part2:
+        return find_first_blocking_byte(byte_positions)
+    memory_space = simulate_memory_corruption(byte_positions[:1024], grid_size=70)
+    return shortest_path(memory_space, end=(70, 70))
+
+
 def main():
     byte_positions = load_byte_positions('input.txt')
 
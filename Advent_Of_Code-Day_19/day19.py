@@ -24,8 +24,8 @@ def count_ways(design, patterns):
     return dp[n]
 
 
-def main():
-    with open('input.txt', 'r') as f:
+def parse(filename):
+    with open(filename, 'r') as f:
         data = f.read().splitlines()
 
     # Find the blank line index
@@ -38,6 +38,18 @@ def main():
     # Extract patterns and designs
     patterns = data[0].split(', ')
     designs = data[blank_line_index + 1:]
+    return patterns, designs
+
+
+def solve(data, part2=False):
+    patterns, designs = data
+    if part2:
+        return sum(count_ways(design, patterns) for design in designs)
+    return sum(1 for design in designs if can_form_design(design, patterns))
+
+
+def main():
+    patterns, designs = parse('input.txt')
 
     # Part 1: Count the number of possible designs
     possible_count = 0
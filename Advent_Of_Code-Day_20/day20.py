@@ -85,6 +85,18 @@ def calculate_cheats(race: Dict[Complex, int], grid: Dict[Complex, str], cheat_m
     return len(walls)
 
 
+def parse(file_path: str) -> Tuple[Dict[Complex, str], Complex, Complex]:
+    """Parses the grid for the batch runner."""
+    return parse_grid(file_path)
+
+
+def solve(parsed: Tuple[Dict[Complex, str], Complex, Complex], part2: bool = False) -> int:
+    """Counts the cheats of up to 2 (part 1) or 20 (part 2) picoseconds."""
+    grid, start, end = parsed
+    race = get_race_path(grid, start, end)
+    return calculate_cheats(race, grid, 20 if part2 else 2)
+
+
 if __name__ == "__main__":
     t = time()
     file_path = "input.txt"
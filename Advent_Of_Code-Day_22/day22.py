@@ -60,11 +60,27 @@ def part2(input_numbers):
     return max(result)
 
 
-# Load input from file
-input_numbers = parse_input('input.txt')
+_part2 = part2
 
-# Part 1
-print(f"Part 1: {part1(input_numbers)}")
 
-# Part 2
-print(f"Part 2: {part2(input_numbers)}")
+def parse(file_name):
+    """Parse input for the batch runner"""
+    return parse_input(file_name)
+
+
+def solve(input_numbers, part2=False):
+    """Solve part 1 or part 2 on the parsed numbers"""
+    if part2:
+        return _part2(input_numbers)
+    return part1(input_numbers)
+
+
+if __name__ == "__main__":
+    # Load input from file
+    input_numbers = parse_input('input.txt')
+
+    # Part 1
+    print(f"Part 1: {part1(input_numbers)}")
+
+    # Part 2
+    print(f"Part 2: {part2(input_numbers)}")
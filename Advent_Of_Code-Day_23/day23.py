@@ -4,24 +4,32 @@ def solve_lan_party(filename):
     """Solves the LAN party problem, counting sets and finding the password."""
 
     try:
-        with open(filename, 'r') as f:
-            connections = [line.strip().split('-') for line in f]
+        connections = parse(filename)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None, None
 
+    return count_t_triangles(connections), find_password(connections)
+
+
+def parse(filename):
+    """Reads the list of computer-to-computer connections."""
+    with open(filename, 'r') as f:
+        return [line.strip().split('-') for line in f if line.strip()]
+
+
+def build_graph(connections):
+    """Builds an adjacency set for every computer."""
     graph = defaultdict(set)
     for a, b in connections:
         graph[a].add(b)
         graph[b].add(a)
+    return graph
 
-    def is_clique(nodes, graph):
-        """Checks if a set of nodes forms a clique."""
-        for i in range(len(nodes)):
-            for j in range(i + 1, len(nodes)):
-                if nodes[j] not in graph[nodes[i]]:
-                    return False
-        return True
+
+def count_t_triangles(connections):
+    """Counts the sets of three connected computers with one starting with t."""
+    graph = build_graph(connections)
 
     # Part 1 logic
     count_part1 = 0
@@ -35,6 +43,20 @@ def solve_lan_party(filename):
                             # Check if the set includes a computer that starts with "t"
                             if any(node.startswith('t') for node in (node1, node2, node3)):
                                 count_part1 += 1
+    return count_part1
+
+
+def find_password(connections):
+    """Finds the largest clique and joins its sorted members into the password."""
+    graph = build_graph(connections)
+
+    def is_clique(nodes, graph):
+        """Checks if a set of nodes forms a clique."""
+        for i in range(len(nodes)):
+            for j in range(i + 1, len(nodes)):
+                if nodes[j] not in graph[nodes[i]]:
+                    return False
+        return True
 
     # Part 2 logic
     max_clique = []
@@ -51,17 +73,21 @@ def solve_lan_party(filename):
                        queue.append(current_nodes + [next_node])
 
     max_clique.sort()
-    password = ",".join(max_clique)
+    return ",".join(max_clique)
+
 
-    return count_part1, password
+def solve(connections, part2=False):
+    """Returns the part 1 triangle count or the part 2 password."""
+    return find_password(connections) if part2 else count_t_triangles(connections)
 
 
-# Example usage:
-filename = "input.txt"
-relevant_sets, lan_party_password = solve_lan_party(filename)
+if __name__ == "__main__":
+    # Example usage:
+    filename = "input.txt"
+    relevant_sets, lan_party_password = solve_lan_party(filename)
 
-if relevant_sets is not None:
-    print(f"Number of sets of three inter-connected computers with at least one t (Part 1): {relevant_sets}")
+    if relevant_sets is not None:
+        print(f"Number of sets of three inter-connected computers with at least one t (Part 1): {relevant_sets}")
 
-if lan_party_password is not None:
-    print(f"The password for the LAN party (Part 2): {lan_party_password}")
\ No newline at end of file
+    if lan_party_password is not None:
+        print(f"The password for the LAN party (Part 2): {lan_party_password}")
@@ -0,0 +1,177 @@
+"""Repeatable benchmarks for every day's parse, part 1 and part 2.
+
+Each stage is run against the checked-in ``input.txt`` with a number of
+warmup rounds followed by timed repetitions. The median and p95 of every
+stage are appended to a JSON history file, and any stage whose median has
+grown beyond the threshold relative to recent history is reported as a
+regression (the script then exits with status 1, for use in nightly jobs).
+
+Usage:
+    python benchmark.py                    # all days, 5 repetitions
+    python benchmark.py 6 20 -n 10 -w 2    # selected days
+    python benchmark.py --threshold 0.1 --history bench.json
+"""
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+from input_cache import cached_parse
+from run_all import ROOT, discover_days, load_day
+
+DEFAULT_HISTORY = ROOT / "benchmark_history.json"
+STAGES = ("parse", "part1", "part2")
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a non-empty list of samples."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def time_day(module_path, repeat=5, warmup=1, use_cache=False):
+    """Times parse, part 1 and part 2 of one day and returns per-stage samples.
+
+    With use_cache the parse stage measures a load from the binary input cache
+    (the first warmup round populates it) instead of the text parser.
+    """
+    module = load_day(module_path)
+    input_path = Path(module_path).parent / "input.txt"
+    samples = {stage: [] for stage in STAGES}
+
+    for round_index in range(warmup + repeat):
+        start = perf_counter()
+        data = cached_parse(module, input_path) if use_cache else module.parse(input_path)
+        parse_time = perf_counter() - start
+
+        start = perf_counter()
+        module.solve(data)
+        part1_time = perf_counter() - start
+
+        start = perf_counter()
+        module.solve(data, part2=True)
+        part2_time = perf_counter() - start
+
+        if round_index >= warmup:
+            samples["parse"].append(parse_time)
+            samples["part1"].append(part1_time)
+            samples["part2"].append(part2_time)
+
+    return samples
+
+
+def summarize(samples):
+    """Reduces per-stage samples to median and p95 seconds."""
+    return {
+        stage: {"median": statistics.median(times), "p95": percentile(times, 95)}
+        for stage, times in samples.items()
+    }
+
+
+def load_history(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open("r") as f:
+        return json.load(f)
+
+
+def save_history(path, history):
+    with Path(path).open("w") as f:
+        json.dump(history, f, indent=2)
+
+
+def find_regressions(history, results, threshold=0.2, window=5, min_time=0.001, cache=False):
+    """Compares each stage median against the median of the last `window` runs.
+
+    Only runs made with the same `cache` setting count towards the baseline,
+    since cached parse times are not comparable with text parsing. Stages
+    faster than `min_time` seconds are ignored since their timings are
+    dominated by noise. Returns (day, stage, baseline, current) tuples.
+    """
+    history = [run for run in history if run.get("cache", False) == cache]
+    regressions = []
+    for day, stages in results.items():
+        for stage, stats in stages.items():
+            previous = [run["results"][day][stage]["median"]
+                        for run in history[-window:]
+                        if day in run["results"]]
+            if not previous:
+                continue
+            baseline = statistics.median(previous)
+            current = stats["median"]
+            if current >= min_time and current > baseline * (1 + threshold):
+                regressions.append((day, stage, baseline, current))
+    return regressions
+
+
+def format_report(results):
+    header = f"{'Day':>3}  " + "  ".join(f"{stage + ' med':>11}  {stage + ' p95':>11}" for stage in STAGES)
+    lines = [header, "-" * len(header)]
+    for day, stages in results.items():
+        cells = "  ".join(
+            f"{stages[stage]['median'] * 1000:>9.2f}ms  {stages[stage]['p95'] * 1000:>9.2f}ms"
+            for stage in STAGES
+        )
+        lines.append(f"{day:>3}  {cells}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Advent of Code 2024 solvers.")
+    parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed repetitions per day")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed warmup rounds per day")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (0.2 = 20%%)")
+    parser.add_argument("--window", type=int, default=5,
+                        help="number of previous runs the baseline is taken from")
+    parser.add_argument("--cache", action="store_true",
+                        help="time loading from the binary input cache as the parse stage")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    available = discover_days()
+    missing = [day for day in args.days if day not in available]
+    if missing:
+        print(f"Error: no solver for day(s) {', '.join(map(str, missing))}")
+        sys.exit(1)
+    selected = args.days or list(available)
+
+    # JSON object keys are strings, so days are keyed by str throughout
+    results = {}
+    for day in selected:
+        results[str(day)] = summarize(time_day(available[day], args.repeat, args.warmup, args.cache))
+    print(format_report(results))
+
+    history = load_history(args.history)
+    regressions = find_regressions(history, results, args.threshold, args.window, cache=args.cache)
+
+    if not args.no_save:
+        history.append({
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "cache": args.cache,
+            "results": results,
+        })
+        save_history(args.history, history)
+
+    if regressions:
+        print("\nRegressions:")
+        for day, stage, baseline, current in regressions:
+            print(f"  Day {day} {stage}: {baseline * 1000:.2f}ms -> {current * 1000:.2f}ms "
+                  f"(+{(current / baseline - 1) * 100:.0f}%)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
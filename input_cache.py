@@ -0,0 +1,321 @@
+"""Binary cache for parsed puzzle inputs.
+
+``cached_parse(module, input_path)`` returns the same value as
+``module.parse(input_path)`` but stores it in a compact binary file keyed by
+the SHA-256 of the input and of the day module's source, so editing a parser
+(or anything it calls in that file) invalidates its entries. An optional
+``PARSER_VERSION`` in the module forces invalidation for changes outside it.
+Later runs memory-map that file and rebuild the structure without touching
+the text parser.
+
+The encoding is a small tagged format. Runs of int64 values (flat int lists,
+rectangular int matrices such as lists of coordinate tuples) are written as
+raw 8-byte-aligned arrays and read back through ``memoryview.cast``; lists
+of strings are stored as one length array plus a UTF-8 blob; dicts are
+stored as a key list and a value list so both hit those fast paths. Values
+the format does not know (e.g. day 14's ``Robot`` objects) fall back to
+pickle.
+"""
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".aoc_cache"
+MAGIC = b"AOCC"
+FORMAT_VERSION = 1
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+DEFAULT_FACTORIES = {"list": list, "str": str, "int": int, "set": set}
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+def _is_int64(value):
+    return type(value) is int and INT64_MIN <= value <= INT64_MAX
+
+
+class _Writer:
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def tag(self, tag):
+        self.buffer += tag
+
+    def u64(self, value):
+        self.buffer += _U64.pack(value)
+
+    def raw(self, data):
+        self.u64(len(data))
+        self.buffer += data
+
+    def int_array(self, values):
+        """Writes int64 values padded so the payload starts 8-byte aligned."""
+        self.u64(len(values))
+        self.buffer += b"\0" * (-len(self.buffer) % 8)
+        self.buffer += array("q", values).tobytes()
+
+    def value(self, value):
+        kind = type(value)
+        if value is None:
+            self.tag(b"N")
+        elif kind is bool:
+            self.tag(b"T" if value else b"F")
+        elif kind is int:
+            if _is_int64(value):
+                self.tag(b"i")
+                self.buffer += _I64.pack(value)
+            else:
+                self.tag(b"I")
+                self.raw(str(value).encode())
+        elif kind is float:
+            self.tag(b"f")
+            self.buffer += _F64.pack(value)
+        elif kind is complex:
+            self.tag(b"c")
+            self.buffer += _F64.pack(value.real) + _F64.pack(value.imag)
+        elif kind is str:
+            self.tag(b"s")
+            self.raw(value.encode())
+        elif kind is list or kind is tuple:
+            self.sequence(value)
+        elif kind is dict:
+            self.tag(b"d")
+            self.mapping(value)
+        elif kind is defaultdict and value.default_factory in DEFAULT_FACTORIES.values():
+            self.tag(b"D")
+            self.raw(value.default_factory.__name__.encode())
+            self.mapping(value)
+        else:
+            self.tag(b"p")
+            self.raw(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def mapping(self, value):
+        self.sequence(list(value.keys()))
+        self.sequence(list(value.values()))
+
+    def sequence(self, value):
+        container = b"t" if type(value) is tuple else b"l"
+        if value and all(_is_int64(item) for item in value):
+            self.tag(b"a" + container)
+            self.int_array(value)
+        elif value and all(type(item) is str for item in value):
+            self.tag(b"S" + container)
+            self.int_array([len(item) for item in value])
+            self.raw("".join(value).encode())
+        elif value and all(type(item) is complex for item in value):
+            self.tag(b"z" + container)
+            self.u64(2 * len(value))
+            self.buffer += b"\0" * (-len(self.buffer) % 8)
+            self.buffer += array("d", [part for item in value for part in (item.real, item.imag)]).tobytes()
+        elif self._is_int_matrix(value):
+            rows = value[0]
+            self.tag(b"m" + container + (b"t" if type(rows) is tuple else b"l"))
+            self.u64(len(rows))
+            self.int_array([item for row in value for item in row])
+        elif self._is_ragged(value):
+            flat = [item for row in value for item in row]
+            self.tag(b"r" + container + (b"t" if type(value[0]) is tuple else b"l"))
+            self.int_array([len(row) for row in value])
+            self.sequence(flat)
+        elif value and len({type(item) for item in value}) == 1 and not self._is_native(value[0]):
+            # A homogeneous run of foreign objects is pickled in one go
+            self.tag(b"p")
+            self.raw(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        else:
+            self.tag(container)
+            self.u64(len(value))
+            for item in value:
+                self.value(item)
+
+    @staticmethod
+    def _is_native(item):
+        return type(item) in (type(None), bool, int, float, complex, str, list, tuple, dict, defaultdict)
+
+    @staticmethod
+    def _is_ragged(value):
+        """Rows of one container type whose items are all int64 or all str."""
+        if not value or type(value[0]) not in (list, tuple):
+            return False
+        row_type = type(value[0])
+        if not all(type(row) is row_type for row in value):
+            return False
+        flat = [item for row in value for item in row]
+        return bool(flat) and (all(_is_int64(item) for item in flat)
+                               or all(type(item) is str for item in flat))
+
+    @staticmethod
+    def _is_int_matrix(value):
+        if not value or type(value[0]) not in (list, tuple):
+            return False
+        row_type, width = type(value[0]), len(value[0])
+        return width > 0 and all(
+            type(row) is row_type and len(row) == width and all(_is_int64(item) for item in row)
+            for row in value
+        )
+
+
+class _Reader:
+    def __init__(self, view):
+        self.view = view
+        self.offset = 0
+
+    def take(self, size):
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.view):
+            raise ValueError("truncated cache file")
+        return self.view[start:self.offset]
+
+    def tag(self):
+        return bytes(self.take(1))
+
+    def u64(self):
+        return _U64.unpack(self.take(8))[0]
+
+    def raw(self):
+        return bytes(self.take(self.u64()))
+
+    def typed_array(self, typecode):
+        count = self.u64()
+        self.offset += -self.offset % 8
+        chunk = self.take(count * 8)
+        return chunk.cast(typecode).tolist()
+
+    def container(self, items, container):
+        return tuple(items) if container == b"t" else list(items)
+
+    def value(self):
+        tag = self.tag()
+        if tag == b"N":
+            return None
+        if tag in (b"T", b"F"):
+            return tag == b"T"
+        if tag == b"i":
+            return _I64.unpack(self.take(8))[0]
+        if tag == b"I":
+            return int(self.raw())
+        if tag == b"f":
+            return _F64.unpack(self.take(8))[0]
+        if tag == b"c":
+            return complex(_F64.unpack(self.take(8))[0], _F64.unpack(self.take(8))[0])
+        if tag == b"s":
+            return self.raw().decode()
+        if tag in (b"l", b"t"):
+            return self.container([self.value() for _ in range(self.u64())], tag)
+        if tag == b"a":
+            container = self.tag()
+            return self.container(self.typed_array("q"), container)
+        if tag == b"S":
+            container = self.tag()
+            lengths = self.typed_array("q")
+            blob = self.raw().decode()
+            if lengths.count(1) == len(lengths):
+                return self.container(blob, container)  # Grids of single characters
+            items, position = [], 0
+            for length in lengths:
+                items.append(blob[position:position + length])
+                position += length
+            return self.container(items, container)
+        if tag == b"z":
+            container = self.tag()
+            parts = self.typed_array("d")
+            return self.container(map(complex, parts[0::2], parts[1::2]), container)
+        if tag == b"m":
+            container, row_container = self.tag(), self.tag()
+            width = self.u64()
+            flat = self.typed_array("q")
+            if row_container == b"t":
+                rows = zip(*[iter(flat)] * width)
+            else:
+                rows = (flat[i:i + width] for i in range(0, len(flat), width))
+            return self.container(rows, container)
+        if tag == b"r":
+            container, row_container = self.tag(), self.tag()
+            lengths = self.typed_array("q")
+            flat = self.value()
+            rows, position = [], 0
+            for length in lengths:
+                rows.append(flat[position:position + length])
+                position += length
+            if row_container == b"t":
+                rows = map(tuple, rows)
+            return self.container(rows, container)
+        if tag == b"d":
+            return self.mapping({})
+        if tag == b"D":
+            return self.mapping(defaultdict(DEFAULT_FACTORIES[self.raw().decode()]))
+        if tag == b"p":
+            return pickle.loads(self.raw())
+        raise ValueError(f"unknown cache tag {tag!r}")
+
+    def mapping(self, target):
+        keys = self.value()
+        values = self.value()
+        target.update(zip(keys, values))
+        return target
+
+
+def encode(value):
+    """Serializes a parsed structure to bytes."""
+    writer = _Writer()
+    writer.buffer += MAGIC + bytes([FORMAT_VERSION]) + sys.byteorder[0].encode()
+    writer.value(value)
+    return bytes(writer.buffer)
+
+
+def decode(view):
+    """Rebuilds a parsed structure from bytes or a memoryview over them."""
+    reader = _Reader(memoryview(view))
+    header = bytes(reader.take(len(MAGIC) + 2))
+    if header != MAGIC + bytes([FORMAT_VERSION]) + sys.byteorder[0].encode():
+        raise ValueError("incompatible cache file")
+    return reader.value()
+
+
+def cache_key(module, input_path):
+    """SHA-256 over the input bytes and the day module's source, plus its parser version."""
+    digest = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(Path(module.__file__).read_bytes())
+    version = getattr(module, "PARSER_VERSION", 1)
+    return f"{module.__name__}-v{version}-{digest.hexdigest()}"
+
+
+def load(path):
+    """Memory-maps a cache file and decodes it."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # The mapping is released with the last view over it, even if decoding fails
+    return decode(memoryview(mapped))
+
+
+def store(path, value):
+    """Writes a cache file atomically so concurrent workers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(encode(value))
+    os.replace(temp_path, path)
+
+
+def cached_parse(module, input_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Returns module.parse(input_path), served from the binary cache when possible."""
+    path = Path(cache_dir) / f"{cache_key(module, input_path)}.bin"
+    if path.exists():
+        try:
+            return load(path)
+        except (ValueError, EOFError, pickle.UnpicklingError):
+            pass  # Stale or corrupt entry, re-parse and overwrite it
+    value = module.parse(input_path)
+    store(path, value)
+    return value
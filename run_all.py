@@ -0,0 +1,146 @@
+"""Runs every day's solver in a single process pool and prints a timing table.
+
+Each ``Advent_Of_Code-Day_NN/dayN.py`` module exposes ``parse(path)`` and
+``solve(data, part2=False)``. Part 1 and part 2 of a day are submitted as
+separate tasks; each task parses its own copy of the input, so the two parts
+never share state and can run side by side. Parsed inputs are served from
+the binary cache in ``input_cache`` unless ``--no-cache`` is given.
+
+Usage:
+    python run_all.py              # all days
+    python run_all.py 6 20 -j 4    # selected days, 4 worker processes
+"""
+import argparse
+import importlib.util
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from time import perf_counter
+
+from input_cache import cached_parse
+
+ROOT = Path(__file__).resolve().parent
+DAY_DIR_PATTERN = re.compile(r"Advent_Of_Code-Day_(\d+)$")
+
+_loaded_days = {}
+
+
+def discover_days(root=ROOT):
+    """Maps each day number to the path of its solver module."""
+    days = {}
+    for directory in root.iterdir():
+        match = DAY_DIR_PATTERN.match(directory.name)
+        if match:
+            day = int(match.group(1))
+            module_path = directory / f"day{day}.py"
+            if module_path.exists():
+                days[day] = module_path
+    return dict(sorted(days.items()))
+
+
+def load_day(module_path):
+    """Imports a day module by path (the directory names are not importable)."""
+    module_path = Path(module_path)
+    if module_path not in _loaded_days:
+        spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module  # Lets pickle find classes defined by the day
+        spec.loader.exec_module(module)
+        _loaded_days[module_path] = module
+    return _loaded_days[module_path]
+
+
+def run_part(day, module_path, input_path, part2, use_cache=True):
+    """Parses the input (through the binary cache) and solves one part, timing both steps."""
+    module = load_day(module_path)
+
+    start = perf_counter()
+    data = cached_parse(module, input_path) if use_cache else module.parse(input_path)
+    parse_time = perf_counter() - start
+
+    start = perf_counter()
+    answer = module.solve(data, part2=part2)
+    solve_time = perf_counter() - start
+
+    return day, part2, parse_time, solve_time, answer
+
+
+def run_all(days=None, workers=None, use_cache=True):
+    """Runs the selected days (all by default) and collects results per day."""
+    available = discover_days()
+    selected = available if not days else {day: available[day] for day in days}
+
+    results = {day: {} for day in selected}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_part, day, module_path, module_path.parent / "input.txt", part2, use_cache): (day, part2)
+            for day, module_path in selected.items()
+            for part2 in (False, True)
+        }
+        for future, (day, part2) in futures.items():
+            try:
+                _, _, parse_time, solve_time, answer = future.result()
+            except Exception as error:
+                # One failing day must not take the rest of the batch down with it
+                results[day][part2] = (None, None, SolverError(error))
+            else:
+                results[day][part2] = (parse_time, solve_time, answer)
+    return results
+
+
+class SolverError:
+    """Stands in for the answer of a part whose parse or solve raised."""
+
+    def __init__(self, error):
+        self.error = error
+
+    def __str__(self):
+        return f"{type(self.error).__name__}: {self.error}"
+
+
+def _format_ms(seconds):
+    return f"{'-':>9}" if seconds is None else f"{seconds * 1000:>7.1f}ms"
+
+
+def format_table(results):
+    """Formats the collected results as a parse/part1/part2 wall-clock table."""
+    header = f"{'Day':>3}  {'Parse':>9}  {'Part 1':>9}  {'Part 2':>9}  {'Answer 1':>20}  {'Answer 2':>20}"
+    lines = [header, "-" * len(header)]
+    for day, parts in results.items():
+        parse1, time1, answer1 = parts[False]
+        parse2, time2, answer2 = parts[True]
+        parse_times = [t for t in (parse1, parse2) if t is not None]
+        lines.append(
+            f"{day:>3}  {_format_ms(min(parse_times, default=None))}  {_format_ms(time1)}  "
+            f"{_format_ms(time2)}  {str(answer1):>20}  {str(answer2):>20}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run all Advent of Code 2024 solvers.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always parse the text input instead of using the binary cache")
+    args = parser.parse_args(argv)
+
+    available = discover_days()
+    missing = [day for day in args.days if day not in available]
+    if missing:
+        print(f"Error: no solver for day(s) {', '.join(map(str, missing))}")
+        sys.exit(1)
+
+    start = perf_counter()
+    results = run_all(args.days, args.workers, use_cache=not args.no_cache)
+    print(format_table(results))
+    print(f"Total wall-clock time: {perf_counter() - start:.2f}s")
+    if any(isinstance(answer, SolverError) for parts in results.values() for _, _, answer in parts.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()